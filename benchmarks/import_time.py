@@ -0,0 +1,93 @@
+"""
+Start-up time of a fresh interpreter importing the dataset packages and, if a cache directory
+is given, reading a cached season with `get()` and the cached player ID map with
+`ids.get_mapping()`. Also lists which of the heavy optional imports (the web source, `requests`,
+`tqdm`, the `cols` modules) were loaded, none of which should be needed for a cache hit (other
+than `nfldpw.players.ids` itself for the ID map).
+
+```
+python benchmarks/import_time.py
+python benchmarks/import_time.py path_to_cache/ 2023
+```
+"""
+
+import json
+import subprocess
+import sys
+
+
+HEAVY_MODULES = [
+    "nfl_data_py",
+    "requests",
+    "tqdm",
+    "nfldpw.pbp.cols",
+    "nfldpw.rosters.cols",
+    "nfldpw.schedules.cols",
+    "nfldpw.players.ids",
+]
+
+REPEATS = 5
+
+SCRIPT = """
+import json
+import sys
+import time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "loaded": loaded}}))
+"""
+
+GET = "from nfldpw import {dataset}; {dataset}.get([{season}], {cache_path!r})"
+
+GET_MAPPING = "from nfldpw.players import ids; ids.get_mapping({cache_path!r})"
+
+
+def measure(statement: str) -> tuple[float, list[str]]:
+    """
+    Best time of `REPEATS` fresh interpreters running `statement`, and the heavy modules it loaded.
+    """
+    script = SCRIPT.format(statement=statement, heavy=HEAVY_MODULES)
+    best = None
+    loaded = []
+    for _ in range(REPEATS):
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if best is None or result["elapsed"] < best:
+            best = result["elapsed"]
+        loaded = result["loaded"]
+    return best, loaded
+
+
+def main():
+    statements = {
+        "import pandas, pyarrow": "import pandas, pyarrow",
+        "import nfldpw.pbp": "import nfldpw.pbp",
+        "import every dataset": (
+            "from nfldpw import pbp, rosters, schedules, drafts, players"
+        ),
+    }
+    if len(sys.argv) > 2:
+        cache_path, season = sys.argv[1], int(sys.argv[2])
+        for dataset in ["pbp", "rosters"]:
+            statements[dataset + ".get() cache hit"] = GET.format(
+                dataset=dataset, season=season, cache_path=cache_path
+            )
+        statements["ids.get_mapping() cache hit"] = GET_MAPPING.format(
+            cache_path=cache_path
+        )
+    for name, statement in statements.items():
+        elapsed, loaded = measure(statement)
+        print(
+            name.ljust(28),
+            format(elapsed * 1000, ".0f").rjust(6),
+            "ms",
+            " loaded: " + (", ".join(loaded) or "-"),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Size on disk and load time of a play-by-play season for each cache storage setting.
+
+Runs against a synthetic season by default. Pass a cache directory and season to benchmark
+a real season from the cache instead.
+
+```
+python benchmarks/parquet_settings.py
+python benchmarks/parquet_settings.py path_to_cache/ 2023
+```
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import numpy
+import pandas
+import nfldpw.cache.cache as cache
+
+
+SETTINGS = {
+    "snappy": {"compression": "snappy"},
+    "zstd-3": {"compression": "zstd", "compression_level": 3},
+    "zstd-9": {"compression": "zstd", "compression_level": 9},
+    "lz4": {"compression": "lz4"},
+    "none": {"compression": "none"},
+    "zstd-3 no-dictionary": {
+        "compression": "zstd",
+        "compression_level": 3,
+        "use_dictionary": False,
+    },
+    "zstd-3 game row groups": {
+        "compression": "zstd",
+        "compression_level": 3,
+        "row_group_by": "game_id",
+    },
+    "zstd-3 week row groups": {
+        "compression": "zstd",
+        "compression_level": 3,
+        "row_group_by": "week",
+    },
+}
+
+FORMATS = ["arrow", "arrow-lz4"]
+
+TEAMS = ["ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE"]
+TEAMS += ["DAL", "DEN", "DET", "GB", "HOU", "IND", "JAX", "KC"]
+TEAMS += ["LA", "LAC", "LV", "MIA", "MIN", "NE", "NO", "NYG"]
+TEAMS += ["NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS"]
+
+PLAY_TYPES = ["pass", "run", "punt", "kickoff", "field_goal", "no_play"]
+
+NUM_WEEKS = 18
+GAMES_PER_WEEK = 16
+PLAYS_PER_GAME = 175
+NUM_FLOATS = 120
+NUM_FLAGS = 60
+NUM_IDS = 20
+
+REPEATS = 5
+
+
+def synthetic_season(season: int = 2023) -> pandas.DataFrame:
+    rng = numpy.random.default_rng(season)
+    n = NUM_WEEKS * GAMES_PER_WEEK * PLAYS_PER_GAME
+    week = numpy.repeat(numpy.arange(1, NUM_WEEKS + 1), GAMES_PER_WEEK * PLAYS_PER_GAME)
+    game = numpy.repeat(numpy.arange(NUM_WEEKS * GAMES_PER_WEEK), PLAYS_PER_GAME)
+    home = numpy.array(TEAMS)[(game * 2) % len(TEAMS)]
+    away = numpy.array(TEAMS)[(game * 2 + 1) % len(TEAMS)]
+    data = {
+        "play_id": numpy.tile(numpy.arange(PLAYS_PER_GAME), len(numpy.unique(game))),
+        "game_id": [
+            str(season) + "_" + str(w).zfill(2) + "_" + a + "_" + h
+            for w, a, h in zip(week, away, home)
+        ],
+        "season": season,
+        "week": week,
+        "posteam": numpy.where(rng.random(n) < 0.5, home, away),
+        "play_type": rng.choice(PLAY_TYPES, n),
+        "desc": ["(" + str(i % 900) + ") play description " + str(i) for i in range(n)],
+    }
+    for i in range(NUM_FLOATS):
+        data["float_" + str(i)] = rng.normal(size=n)
+    for i in range(NUM_FLAGS):
+        data["flag_" + str(i)] = (rng.random(n) < 0.1).astype("float64")
+    for i in range(NUM_IDS):
+        data["player_id_" + str(i)] = [
+            "00-00" + str(x).zfill(5) for x in rng.integers(0, 3000, n)
+        ]
+    return pandas.DataFrame(data)
+
+
+def _time_load(cache_path: str, fname: str) -> float:
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        cache.load(cache_path, fname)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def _size(cache_path: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(root, file))
+        for root, _, files in os.walk(cache_path)
+        for file in files
+        if not file.startswith("_mdata")
+    )
+
+
+def run(df: pandas.DataFrame) -> pandas.DataFrame:
+    results = []
+    fname = cache.fname_pbp(int(df["season"].iloc[0]), 0)
+    cases = [("parquet " + name, "parquet", opts) for name, opts in SETTINGS.items()]
+    cases += [(fmt, fmt, {}) for fmt in FORMATS]
+    pbp_options = cache.PARQUET_OPTIONS.get("pbp", {})
+    for name, fmt, options in cases:
+        cache_path = tempfile.mkdtemp() + "/"
+        try:
+            cache.set_format(cache_path, fmt)
+            cache.PARQUET_OPTIONS["pbp"] = options
+            start = time.perf_counter()
+            cache.dump(df, cache_path, fname)
+            dump_time = time.perf_counter() - start
+            results.append(
+                {
+                    "setting": name,
+                    "size (MB)": round(_size(cache_path) / 1024**2, 2),
+                    "dump (s)": round(dump_time, 3),
+                    "load (s)": round(_time_load(cache_path, fname), 3),
+                }
+            )
+        finally:
+            shutil.rmtree(cache_path)
+    cache.PARQUET_OPTIONS["pbp"] = pbp_options
+    return pandas.DataFrame(results)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        import nfldpw.pbp
+
+        df = nfldpw.pbp.get([int(sys.argv[2])], sys.argv[1])
+    else:
+        df = synthetic_season()
+    print("rows:", len(df), "columns:", len(df.columns))
+    print(run(df).to_string(index=False))
@@ -1,18 +1,54 @@
-from .cache import load_mdata
-from .cache import dump_mdata
 from .cache import load
+from .cache import load_table
+from .cache import to_table
+from .cache import concat_tables
+from .cache import output
+from .cache import headers
+from .cache import select
+from .cache import iter_chunks
+from .cache import chunk_columns
+from .cache import predicates
+from .cache import read_columns
+from .cache import set_arrow_strings
+from .cache import use_arrow_strings
 from .cache import dump
+from .cache import exists
+from .cache import stored_columns
+from .cache import upgrade_column
+from .cache import get_format
+from .cache import set_format
+from .cache import convert
+from .cache import dataset
+from .cache import parquet_options
+from .cache import set_parquet_options
 from .cache import fname_pbp
-from .cache import load_pbp_mdata
-from .cache import dump_pbp_mdata
+from .cache import fname_pbp_legacy
 from .cache import fname_schedules
-from .cache import load_schedules_mdata
-from .cache import dump_schedules_mdata
-from .cache import load_rosters_mdata
-from .cache import dump_rosters_mdata
 from .cache import fname_rosters
 from .cache import fname_players
+from .cache import fname_ids
+from .cache import fname_ids_legacy
+from .cache import fname_idmap
+from .cache import fname_idmap_legacy
+from .cache import fname_idkeeper
+from .cache import fname_idkeeper_legacy
 from .cache import fname_superbowls
 from .cache import fname_drafts
-from .cache import load_drafts_mdata
-from .cache import dump_drafts_mdata
+from .mdata import MdataStore
+from .mdata import partition
+from .mdata import checksum
+from .mdata import schema_hash
+from .memory import set_memory_budget
+from .memory import memory_stats
+from .memory import clear_memory
+from .compaction import compact
+from .compaction import set_compaction
+from .fetch import fetch
+from .fetch import set_fetch_workers
+from .fetch import split_seasons
+from .aio import run_async
+from .aio import set_async_limit
+from .revalidate import revalidate
+from .revalidate import classify
+from .revalidate import revalidate_seasons
+from .revalidate import wait_for_refreshes
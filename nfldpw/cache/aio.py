@@ -0,0 +1,42 @@
+import asyncio
+import weakref
+
+
+ASYNC = {"limit": 4}
+
+_SEMAPHORES = weakref.WeakKeyDictionary()
+
+
+def set_async_limit(limit: int):
+    """
+    Set the number of `aget()` calls that may read the cache or fetch from the web source at the
+    same time within an event loop (default `4`). Further calls wait for a free slot.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    ASYNC["limit"] = limit
+    _SEMAPHORES.clear()
+
+
+def _semaphore() -> asyncio.Semaphore:
+    """
+    Semaphore bounding the `aget()` calls of the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    if loop not in _SEMAPHORES:
+        _SEMAPHORES[loop] = asyncio.Semaphore(ASYNC["limit"])
+    return _SEMAPHORES[loop]
+
+
+async def run_async(func, *args, **kwargs):
+    """
+    Run the blocking `func(*args, **kwargs)` in a worker thread without blocking the event loop,
+    waiting for a free slot if `set_async_limit()` calls are already running.
+
+    Examples
+    --------
+
+        >>> df = await cache.run_async(pbp.get, [2023], "path_to_cache/")
+    """
+    async with _semaphore():
+        return await asyncio.to_thread(func, *args, **kwargs)
@@ -1,9 +1,50 @@
 import pandas
-import json
+import pyarrow
+import pyarrow.parquet
 import os
+import operator
+from typing import Iterator
+from .memory import MEMORY
+from .mdata import MdataStore
+from . import formats
 
 
-def fname_pbp(season: int) -> str:
+FORMATS = [formats.PARQUET, formats.ARROW, formats.ARROW_LZ4]
+
+_FORMAT_MEMO = {}
+
+_UPGRADED = set()
+
+STRINGS = {"arrow": True}
+
+PARQUET_OPTIONS = {
+    "pbp": {
+        "compression": "zstd",
+        "compression_level": 3,
+    },
+    "rosters": {
+        "compression": "zstd",
+        "compression_level": 3,
+        "row_group_by": "week",
+    },
+}
+
+
+def fname_pbp(season: int, week: int = None) -> str:
+    """
+    Play-by-play data is stored as a hive-style dataset partitioned by season and week, i.e.
+    `pbp/season=2023/week=05/part-0.parq`. Without a `week` the season directory is returned.
+    """
+    fname = "pbp/season=" + str(season)
+    if week is not None:
+        fname += "/week=" + str(week).zfill(2) + "/part-0"
+    return fname
+
+
+def fname_pbp_legacy(season: int) -> str:
+    """
+    Single file play-by-play seasons written before the cache was partitioned by week.
+    """
     return "pbp-" + str(season)
 
 
@@ -23,77 +64,444 @@ def fname_players() -> str:
     return "players"
 
 
-def fname_superbowls() -> str:
-    return "sbowls"
-
-
-def load(cache_path: str, fname: str) -> pandas.DataFrame:
-    path = cache_path + fname + ".parq"
-    return pandas.read_parquet(path)
-
-
-def dump(df: pandas.DataFrame, cache_path: str, fname: str):
-    path = cache_path + fname + ".parq"
-    df.to_parquet(path)
-
-
-def load_mdata(cache_path: str, mdata_type: str) -> dict:
-    mdata = {}
-    path = cache_path + "_mdata-" + mdata_type + ".json"
-    if os.path.exists(path):
-        with open(path, "r") as file:
-            mdata = json.load(file)
-    return mdata
-
+def fname_ids() -> str:
+    return "ids"
 
-def dump_mdata(mdata: dict, cache_path: str, mdata_type: str):
-    with open(cache_path + "_mdata-" + mdata_type + ".json", "w") as file:
-        json.dump(mdata, file)
 
+def fname_ids_legacy() -> str:
+    """
+    CSV player ID map written before the map was stored in the cache format.
+    """
+    return "players-idraw.csv"
 
-def load_pbp_mdata(cache_path: str) -> dict:
-    mdata = load_mdata(cache_path, "pbp")
-    new_mdata = {}
-    for season in mdata:
-        new_mdata[int(season)] = mdata[season]
-    return new_mdata
 
+def fname_idmap() -> str:
+    return "players-idmap"
 
-def dump_pbp_mdata(mdata: dict, cache_path: str):
-    dump_mdata(mdata, cache_path, "pbp")
 
+def fname_idmap_legacy() -> str:
+    """
+    CSV `IDMap` written before it was stored in the cache format.
+    """
+    return "players-idmap.csv"
 
-def load_drafts_mdata(cache_path: str) -> dict:
-    mdata = load_mdata(cache_path, "drafts")
-    new_mdata = {}
-    for season in mdata:
-        new_mdata[int(season)] = mdata[season]
-    return new_mdata
 
+def fname_idkeeper() -> str:
+    return "players-idkeeper"
 
-def dump_drafts_mdata(mdata: dict, cache_path: str):
-    dump_mdata(mdata, cache_path, "drafts")
 
+def fname_idkeeper_legacy() -> str:
+    """
+    CSV `IDKeeper` written before it was stored in the cache format.
+    """
+    return "players-idkeeper.csv"
 
-def load_schedules_mdata(cache_path: str) -> dict:
-    mdata = load_mdata(cache_path, "schedules")
-    new_mdata = {}
-    for season in mdata:
-        new_mdata[int(season)] = True
-    return new_mdata
 
-
-def dump_schedules_mdata(mdata: dict, cache_path: str):
-    dump_mdata(mdata, cache_path, "schedules")
-
-
-def load_rosters_mdata(cache_path: str) -> dict:
-    mdata = load_mdata(cache_path, "rosters")
-    new_mdata = {}
-    for season in mdata:
-        new_mdata[int(season)] = True
-    return new_mdata
+def fname_superbowls() -> str:
+    return "sbowls"
 
 
-def dump_rosters_mdata(mdata: dict, cache_path: str):
-    dump_mdata(mdata, cache_path, "rosters")
+def headers(columns: list | None) -> list[str] | None:
+    """
+    Convert `columns` to a list of header strings. Each item may either be a header string
+    or a `cols` class (i.e. `pbp.cols.Epa`). Returns `None` if `columns` is `None`.
+    """
+    if columns is None:
+        return None
+    return [col if isinstance(col, str) else col.header for col in columns]
+
+
+def select(df: pandas.DataFrame, columns: list[str] | None) -> pandas.DataFrame:
+    """
+    Select `columns` from `df`, or return `df` unchanged if `columns` is `None`.
+    """
+    if columns is None:
+        return df
+    return df[columns]
+
+
+def iter_chunks(
+    df: pandas.DataFrame, by: str | None, columns: list[str] | None = None
+) -> Iterator[pandas.DataFrame]:
+    """
+    Yield `df` whole if `by` is `None`, otherwise one chunk per value of the column `by` (i.e.
+    per week or game) in order of appearance. `columns` are selected from each chunk.
+    """
+    if by is None:
+        yield select(df, columns)
+        return
+    for _, chunk in df.groupby(by, sort=False, observed=True, dropna=False):
+        yield select(chunk, columns)
+
+
+def chunk_columns(columns: list[str] | None, by: str | None) -> list[str] | None:
+    """
+    Columns that must be loaded to select `columns` from chunks split by the column `by`.
+    """
+    if columns is None or by is None or by in columns:
+        return columns
+    return columns + [by]
+
+
+FILTER_OPS = {
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda series, value: series.isin(value),
+    "not in": lambda series, value: ~series.isin(value),
+}
+
+
+def _predicate(column, op: str, value, rename: dict) -> tuple:
+    if op not in FILTER_OPS:
+        raise ValueError("Unsupported filter operator: " + str(op))
+    header = column if isinstance(column, str) else column.header
+    if op in ("in", "not in"):
+        value = list(value)
+    return (rename.get(header, header), op, value)
+
+
+def predicates(filters: dict | list | None, rename: dict = None) -> list | None:
+    """
+    Convert `filters` to parquet row filters in disjunctive normal form (a list of lists of
+    `(header, op, value)` tuples). Columns may be given as header strings or `cols` classes.
+
+    `filters` may either be
+
+    * a dictionary of `column: value` pairs, requiring each column to equal the value (or be in
+    the value if it is a list), i.e. `{cols.Week: 5, cols.PlayType: cols.PlayType.PASS}`.
+
+    * a list of `(column, op, value)` tuples that must all hold, i.e. `[(cols.Week, ">=", 5)]`.
+
+    * a list of such lists, any of which must hold.
+
+    Headers found in `rename` are renamed to the header stored in the cache. Returns `None` if
+    `filters` is `None`.
+    """
+    if filters is None:
+        return None
+    rename = rename or {}
+    if isinstance(filters, dict):
+        conjunction = []
+        for column in filters:
+            value = filters[column]
+            if isinstance(value, (list, tuple, set)):
+                conjunction.append(_predicate(column, "in", value, rename))
+            else:
+                conjunction.append(_predicate(column, "==", value, rename))
+        return [conjunction]
+    if len(filters) > 0 and isinstance(filters[0], tuple):
+        filters = [filters]
+    return [[_predicate(*pred, rename) for pred in conj] for conj in filters]
+
+
+def set_arrow_strings(enabled: bool):
+    """
+    Set whether string columns are returned as Arrow-backed `string[pyarrow]` (default `True`)
+    by every `get()` that is not given `arrow_strings` explicitly. Cached strings are then
+    read straight from the Arrow buffers instead of being converted to Python objects.
+    """
+    STRINGS["arrow"] = enabled
+
+
+def use_arrow_strings(arrow_strings: bool | None) -> bool:
+    """
+    Resolve the `arrow_strings` argument of a `get()`, falling back to `set_arrow_strings()`.
+    """
+    if arrow_strings is None:
+        return STRINGS["arrow"]
+    return arrow_strings
+
+
+def read_columns(columns: list[str] | None, filters: list | None) -> list[str] | None:
+    """
+    Columns that must be read to select `columns` after applying `filters`.
+    """
+    if columns is None or filters is None:
+        return columns
+    filter_headers = [pred[0] for conj in filters for pred in conj]
+    return list(dict.fromkeys(columns + filter_headers))
+
+
+def dataset(fname: str) -> str:
+    """
+    Name of the dataset a cache file belongs to, i.e. `"pbp"` for `"pbp/season=2023/week=05/part-0"`.
+    """
+    return fname.split("/")[0].split("-")[0]
+
+
+def parquet_options(dataset: str) -> dict:
+    """
+    Parquet encoding options used when dumping files of `dataset`.
+    """
+    return {**formats.PARQUET_DEFAULTS, **PARQUET_OPTIONS.get(dataset, {})}
+
+
+def set_parquet_options(dataset: str, **options):
+    """
+    Set the parquet encoding options used when dumping files of `dataset`. Files already in the
+    cache keep their encoding until they are re-dumped (or `convert()` is called).
+
+    Parameters
+    ----------
+
+    dataset : str
+        Dataset name, i.e. `"pbp"`, `"rosters"`, `"schedules"`, `"drafts"` or `"players"`
+
+    compression : str
+        Codec, i.e. `"zstd"`, `"lz4"`, `"snappy"`, `"gzip"` or `"none"`
+
+    compression_level : int
+        Codec level (i.e. zstd `1`-`22`)
+
+    use_dictionary : bool | list[str]
+        Whether to dictionary encode columns (or the list of columns to dictionary encode)
+
+    write_statistics : bool
+        Whether to write column statistics used by readers to skip row groups
+
+    row_group_size : int
+        Maximum number of rows per row group
+
+    row_group_by : str
+        Column whose runs of equal values each get their own row group (i.e. `"game_id"` or `"week"`)
+
+    Examples
+    --------
+
+        >>> cache.set_parquet_options("pbp", compression="zstd", compression_level=9)
+    """
+    for option in options:
+        if option not in formats.PARQUET_DEFAULTS:
+            raise ValueError("Unknown parquet option: " + option)
+    PARQUET_OPTIONS[dataset] = {**PARQUET_OPTIONS.get(dataset, {}), **options}
+
+
+def get_format(cache_path: str) -> str:
+    """
+    Storage format of new files in the cache directory, one of `"parquet"` (default),
+    `"arrow"` (uncompressed Arrow IPC / Feather v2) or `"arrow-lz4"`.
+    """
+    if cache_path not in _FORMAT_MEMO:
+        with MdataStore(cache_path) as mdata:
+            _FORMAT_MEMO[cache_path] = mdata.setting("format", formats.PARQUET)
+    return _FORMAT_MEMO[cache_path]
+
+
+def set_format(cache_path: str, fmt: str):
+    """
+    Set the storage format of new files in the cache directory. Existing files stay readable
+    in their current format; use `convert()` to rewrite them.
+
+    Parameters
+    ----------
+
+    cache_path : str
+        Path to a directory where cache files are stored
+
+    fmt : str
+        One of `"parquet"`, `"arrow"` or `"arrow-lz4"`. Arrow IPC files are memory mapped when
+        loaded, so loading is near-instant and pages are shared between processes.
+    """
+    if fmt not in FORMATS:
+        raise ValueError("Unknown cache format: " + str(fmt))
+    with MdataStore(cache_path) as mdata:
+        mdata.set_setting("format", fmt)
+    _FORMAT_MEMO[cache_path] = fmt
+
+
+def convert(cache_path: str, fmt: str):
+    """
+    Rewrite every cache file in the directory to the format `fmt` and make it the directory's format.
+    Parquet files are rewritten too, picking up the current `set_parquet_options()`.
+
+    Examples
+    --------
+
+        >>> cache.convert("path_to_cache/", "arrow")
+    """
+    set_format(cache_path, fmt)
+    for root, _, files in os.walk(cache_path):
+        for file in files:
+            path = os.path.join(root, file)
+            fname, ext = os.path.splitext(os.path.relpath(path, cache_path))
+            fname = fname.replace(os.sep, "/")
+            if ext not in formats.EXTENSIONS.values():
+                continue
+            df = formats.read_table(path).to_pandas()
+            dump(df, cache_path, fname)
+
+
+def exists(cache_path: str, fname: str) -> bool:
+    """
+    Whether a cache file (of any format) or dataset directory is stored under `fname`.
+    """
+    return formats.locate(cache_path + fname) is not None
+
+
+def _stamp(path: str) -> tuple:
+    """
+    Modification time and size of a cache file, or of every file of a dataset directory, so that
+    memory cache entries of files rewritten since (i.e. by another process) are not served.
+    """
+    if not os.path.isdir(path):
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+    stamp = []
+    for root, _, files in os.walk(path):
+        for file in files:
+            if not file.startswith((".", "_")):
+                stat = os.stat(os.path.join(root, file))
+                stamp.append(
+                    (os.path.relpath(root, path), file, stat.st_mtime_ns, stat.st_size)
+                )
+    return tuple(sorted(stamp))
+
+
+def _memory_key(
+    cache_path: str, fname: str, path: str, columns, filters, *options
+) -> tuple:
+    return (
+        cache_path,
+        fname,
+        _stamp(path),
+        None if columns is None else tuple(columns),
+        repr(filters),
+        *options,
+    )
+
+
+def _locate(cache_path: str, fname: str) -> tuple[str, str]:
+    located = formats.locate(cache_path + fname)
+    if located is None:
+        raise FileNotFoundError(cache_path + fname)
+    return located
+
+
+def load(
+    cache_path: str,
+    fname: str,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+    arrow_strings: bool = False,
+) -> pandas.DataFrame:
+    """
+    Load a cache file, or every file of a partitioned dataset if `fname` is a directory.
+    Both parquet and Arrow IPC files are read, regardless of the directory's format.
+    With `arrow_strings`, string columns are returned as `string[pyarrow]`.
+    Served from the in-process memory cache when enabled (see `set_memory_budget()`) unless the
+    file has been rewritten since, i.e. by another process.
+    """
+    path, fmt = _locate(cache_path, fname)
+    key = _memory_key(cache_path, fname, path, columns, filters, arrow_strings)
+    df = MEMORY.get(key)
+    if df is not None:
+        return df
+    df = formats.read(path, fmt, columns, filters, arrow_strings)
+    MEMORY.put(key, df)
+    return df
+
+
+def stored_columns(cache_path: str, fname: str) -> list[str]:
+    """
+    Columns stored in a cache file, read from its metadata without loading any data.
+    """
+    path, fmt = _locate(cache_path, fname)
+    return formats.read_schema(path, fmt).names
+
+
+def upgrade_column(cache_path: str, fname: str, column: str, create) -> bool:
+    """
+    Add `column` to a cache file written without it (i.e. by an older version of this package)
+    by computing it with `create(df)` and rewriting the file, so later loads read it directly.
+    Returns whether the file was rewritten. Checked files are remembered for the process.
+    """
+    key = (cache_path, fname, column)
+    if key in _UPGRADED:
+        return False
+    rewrite = column not in stored_columns(cache_path, fname)
+    if rewrite:
+        dump(create(load(cache_path, fname)), cache_path, fname)
+    _UPGRADED.add(key)
+    return rewrite
+
+
+def load_table(
+    cache_path: str,
+    fname: str,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+) -> pyarrow.Table:
+    """
+    `load()` returning a `pyarrow.Table`, i.e. to assemble several files with `concat_tables()`
+    before converting the result to pandas once.
+    """
+    path, fmt = _locate(cache_path, fname)
+    key = _memory_key(cache_path, fname, path, columns, filters, "arrow")
+    table = MEMORY.get(key)
+    if table is not None:
+        return table
+    table = formats.read_arrow(path, fmt, columns, filters)
+    MEMORY.put(key, table)
+    return table
+
+
+def to_table(
+    df: pandas.DataFrame,
+    filters: list | None = None,
+    columns: list[str] | None = None,
+) -> pyarrow.Table:
+    """
+    Convert `df` (i.e. as fetched from the web source) to a `pyarrow.Table`, applying the parquet
+    row `filters` and selecting `columns` the same way `load_table()` does.
+    """
+    table = pyarrow.Table.from_pandas(df, preserve_index=False)
+    if filters is not None:
+        table = table.filter(pyarrow.parquet.filters_to_expression(filters))
+    if columns is not None:
+        table = table.select(columns)
+    return table
+
+
+def concat_tables(tables: list[pyarrow.Table]) -> pyarrow.Table:
+    """
+    Concatenate `tables` (i.e. one per season) without copying their buffers. Column types that
+    differ between the tables (i.e. a column that is all null in one season) are promoted, and
+    columns that are dictionary encoded in only some of the tables are decoded (see
+    `formats.decode_dictionaries()`).
+    """
+    if len(tables) == 0:
+        return pyarrow.table({})
+    return pyarrow.concat_tables(
+        formats.decode_dictionaries(tables), promote_options="permissive"
+    )
+
+
+def output(
+    table: pyarrow.Table, as_arrow: bool = False, arrow_strings: bool = False
+) -> pandas.DataFrame | pyarrow.Table:
+    """
+    Final result of a `get()`: `table` itself if `as_arrow`, otherwise a single conversion to pandas
+    (see `set_arrow_strings()`).
+    """
+    if as_arrow:
+        return table
+    return formats.to_pandas(table, arrow_strings)
+
+
+def dump(df: pandas.DataFrame, cache_path: str, fname: str, schema=None):
+    """
+    Save `df` to the cache in the directory's format (see `set_format()`) using the dataset's
+    parquet options (see `set_parquet_options()`), creating partition directories as needed.
+    A `pyarrow.Schema` may be given so that all partitions of a dataset share one schema.
+    """
+    path = cache_path + fname
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    formats.write(
+        df, path, get_format(cache_path), schema, parquet_options(dataset(fname))
+    )
+    MEMORY.invalidate(cache_path, fname)
@@ -0,0 +1,146 @@
+import pandas
+
+
+FLAG_CONSTANTS = {"TRUE", "FALSE"}
+
+FLOAT32_SUFFIXES = ("prob", "epa", "wp", "wpa", "wp_post", "cp", "cpoe")
+
+TEAMS = ["ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE"]
+TEAMS += ["DAL", "DEN", "DET", "GB", "HOU", "IND", "JAX", "KC"]
+TEAMS += ["LA", "LAC", "LV", "MIA", "MIN", "NE", "NO", "NYG"]
+TEAMS += ["NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS"]
+TEAMS += ["OAK", "SD", "STL"]
+
+TEAM_HEADERS = ["posteam", "defteam", "side_of_field"]
+
+TEAM_SUFFIX = "_team"
+
+COMPACTION = {
+    "enabled": True,
+    "float32": False,
+}
+
+_COL_CLASSES = {}
+
+
+def set_compaction(enabled: bool = None, float32: bool = None):
+    """
+    Configure the dtype compaction applied to data as it is fetched (and before it is cached).
+
+    Parameters
+    ----------
+
+    enabled : bool = None
+        Whether fetched data is compacted at all (default `True`)
+
+    float32 : bool = None
+        Whether probability and EPA columns (i.e. `epa`, `wp`, `wpa`, `cp`, `*_prob`) are stored as
+        `float32` (default `False`)
+    """
+    if enabled is not None:
+        COMPACTION["enabled"] = enabled
+    if float32 is not None:
+        COMPACTION["float32"] = float32
+
+
+def _col_classes(cols) -> list[type]:
+    if cols.__name__ not in _COL_CLASSES:
+        _COL_CLASSES[cols.__name__] = [
+            getattr(cols, name)
+            for name in dir(cols)
+            if isinstance(getattr(cols, name), type)
+            and hasattr(getattr(cols, name), "header")
+        ]
+    return _COL_CLASSES[cols.__name__]
+
+
+def _constants(col_class: type) -> dict:
+    return {name: value for name, value in vars(col_class).items() if name.isupper()}
+
+
+def _is_string(series: pandas.Series) -> bool:
+    return pandas.api.types.is_object_dtype(
+        series.dtype
+    ) or pandas.api.types.is_string_dtype(series.dtype)
+
+
+def _compact_flag(series: pandas.Series) -> pandas.Series:
+    if not pandas.api.types.is_numeric_dtype(series.dtype):
+        return series
+    if not series.dropna().isin([0, 1]).all():
+        return series
+    return series.astype("Int8")
+
+
+def _compact_category(series: pandas.Series, values: list[str]) -> pandas.Series:
+    if not _is_string(series):
+        return series
+    observed = series.dropna().unique()
+    if not all(isinstance(value, str) for value in observed):
+        return series
+    extra = sorted(set(observed) - set(values))
+    return pandas.Series(
+        pandas.Categorical(series, categories=values + extra),
+        index=series.index,
+        name=series.name,
+    )
+
+
+def compact(df: pandas.DataFrame, cols, float32: bool = None) -> pandas.DataFrame:
+    """
+    Compact the dtypes of `df` using the column metadata in the `cols` module of its dataset.
+
+    * Flag columns (`cols` classes with `TRUE = 1` and `FALSE = 0`) become nullable `Int8`.
+
+    * Categorical string columns (`cols` classes with string value constants, i.e. `cols.PlayType`)
+    become `pandas.Categorical` with the constants as categories. Team columns (i.e. `posteam`,
+    `home_team`) become `pandas.Categorical` with `TEAMS` as categories. Values not found in the
+    categories are appended to them so no data is lost.
+
+    * If `float32` (default from `set_compaction()`), probability and EPA columns become `float32`.
+
+    Parameters
+    ----------
+
+    df : pandas.DataFrame
+        Data as fetched from the web source
+
+    cols
+        The dataset's `cols` module, i.e. `nfldpw.pbp.cols`
+
+    float32 : bool = None
+        Whether probability and EPA columns should be downcast to `float32`
+
+    Returns
+    -------
+
+        out : pandas.DataFrame
+    """
+    if not COMPACTION["enabled"]:
+        return df
+    if float32 is None:
+        float32 = COMPACTION["float32"]
+    compacted = {}
+    for col_class in _col_classes(cols):
+        header = col_class.header
+        if header not in df.columns or header in compacted:
+            continue
+        constants = _constants(col_class)
+        if len(constants) == 0:
+            continue
+        if set(constants) == FLAG_CONSTANTS:
+            compacted[header] = _compact_flag(df[header])
+        elif all(isinstance(value, str) for value in constants.values()):
+            compacted[header] = _compact_category(
+                df[header], list(dict.fromkeys(constants.values()))
+            )
+    for header in df.columns:
+        if header in compacted:
+            continue
+        if header in TEAM_HEADERS or header.endswith(TEAM_SUFFIX):
+            compacted[header] = _compact_category(df[header], TEAMS)
+    if float32:
+        for header in df.columns:
+            if header.endswith(FLOAT32_SUFFIXES) and df[header].dtype == "float64":
+                compacted[header] = df[header].astype("float32")
+    return df.assign(**compacted)
@@ -0,0 +1,70 @@
+import concurrent.futures
+import pandas
+
+
+FETCH = {"max_workers": 4}
+
+
+def set_fetch_workers(max_workers: int):
+    """
+    Set the number of seasons fetched from the web source at the same time (default `4`).
+    Pass `1` to fetch seasons one after another.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    FETCH["max_workers"] = max_workers
+
+
+def fetch(
+    fetch_season, seasons: list[int], max_workers: int = None
+) -> dict[int, pandas.DataFrame]:
+    """
+    Call `fetch_season(season)` for each of `seasons` in a bounded thread pool and return the
+    results keyed by season, in the order of `seasons`. The first exception raised by a fetch
+    is re-raised once the pool has shut down.
+
+    Parameters
+    ----------
+
+    fetch_season : Callable[[int], pandas.DataFrame]
+        Fetches (and compacts) a single season from the web source
+
+    seasons : list[int]
+        Seasons to fetch
+
+    max_workers : int = None
+        Size of the thread pool, defaults to `set_fetch_workers()`
+
+    Returns
+    -------
+
+        out : dict[int, pandas.DataFrame]
+    """
+    seasons = list(dict.fromkeys(seasons))
+    if max_workers is None:
+        max_workers = FETCH["max_workers"]
+    max_workers = min(max_workers, len(seasons))
+    if max_workers <= 1:
+        return {season: fetch_season(season) for season in seasons}
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+        futures = {season: pool.submit(fetch_season, season) for season in seasons}
+        return {season: futures[season].result() for season in seasons}
+
+
+def split_seasons(
+    df: pandas.DataFrame, seasons: list[int], header: str = "season"
+) -> dict[int, pandas.DataFrame]:
+    """
+    Split `df`, fetched for several seasons at once (i.e. from an upstream file covering every
+    season), into one frame per season in a single pass. Seasons without rows get an empty frame.
+
+    Returns
+    -------
+
+        out : dict[int, pandas.DataFrame]
+    """
+    groups = {
+        int(season): season_df.reset_index(drop=True)
+        for season, season_df in df.groupby(header, sort=False)
+    }
+    return {season: groups.get(season, df.iloc[0:0]) for season in seasons}
@@ -0,0 +1,279 @@
+import os
+import threading
+import numpy
+import pandas
+import pyarrow
+import pyarrow.dataset
+import pyarrow.feather
+import pyarrow.fs
+import pyarrow.parquet
+
+
+PARQUET = "parquet"
+ARROW = "arrow"
+ARROW_LZ4 = "arrow-lz4"
+
+EXTENSIONS = {
+    PARQUET: ".parq",
+    ARROW: ".arrow",
+    ARROW_LZ4: ".arrow",
+}
+
+ARROW_COMPRESSION = {
+    ARROW: "uncompressed",
+    ARROW_LZ4: "lz4",
+}
+
+MMAP_FS = pyarrow.fs.LocalFileSystem(use_mmap=True)
+
+ARROW_STRING = pandas.StringDtype("pyarrow")
+
+PARQUET_DEFAULTS = {
+    "compression": "snappy",
+    "compression_level": None,
+    "use_dictionary": True,
+    "write_statistics": True,
+    "row_group_size": None,
+    "row_group_by": None,
+}
+
+
+def _extension_format(fname: str) -> str | None:
+    if fname.endswith(EXTENSIONS[PARQUET]):
+        return PARQUET
+    if fname.endswith(EXTENSIONS[ARROW]):
+        return ARROW
+    return None
+
+
+def locate(path: str) -> tuple[str, str] | None:
+    """
+    Find the file (`path` + extension) or dataset directory (`path`) stored at `path`.
+    Returns the full path and the storage format (`PARQUET` or `ARROW`), or `None` if nothing is stored.
+    """
+    if os.path.isdir(path):
+        for root, _, files in os.walk(path):
+            for file in sorted(files):
+                fmt = _extension_format(file)
+                if fmt is not None:
+                    return path, fmt
+        return None
+    for fmt in [PARQUET, ARROW]:
+        if os.path.exists(path + EXTENSIONS[fmt]):
+            return path + EXTENSIONS[fmt], fmt
+    return None
+
+
+def _string_mapper(dtype: pyarrow.DataType):
+    if pyarrow.types.is_string(dtype) or pyarrow.types.is_large_string(dtype):
+        return ARROW_STRING
+    return None
+
+
+def to_pandas(table: pyarrow.Table, arrow_strings: bool = False) -> pandas.DataFrame:
+    """
+    Convert `table` to a `DataFrame`. With `arrow_strings`, string columns keep their Arrow
+    buffers as `string[pyarrow]` instead of being converted to Python objects.
+    """
+    types_mapper = _string_mapper if arrow_strings else None
+    return table.to_pandas(split_blocks=True, types_mapper=types_mapper)
+
+
+def _runs(path: str) -> list[tuple[str, list[str]]]:
+    """
+    Files of the dataset directory `path` in order, grouped into runs of the same storage format
+    (a directory holds both formats after `set_format()` until it is fully rewritten). Hidden files
+    (starting with `"."` or `"_"`), i.e. files still being written, are skipped.
+    """
+    runs = []
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for file in sorted(files):
+            fmt = _extension_format(file)
+            if fmt is None or file.startswith((".", "_")):
+                continue
+            if len(runs) == 0 or runs[-1][0] != fmt:
+                runs.append((fmt, []))
+            runs[-1][1].append(os.path.join(root, file))
+    return runs
+
+
+def _read_source(
+    source: str | list[str], fmt: str, columns: list[str] | None, filters: list | None
+) -> pyarrow.Table:
+    if fmt == PARQUET:
+        return pyarrow.parquet.read_table(
+            source, columns=columns, filters=filters, partitioning=None
+        )
+    dataset = pyarrow.dataset.dataset(source, format="ipc", filesystem=MMAP_FS)
+    expression = None
+    if filters is not None:
+        expression = pyarrow.parquet.filters_to_expression(filters)
+    return dataset.to_table(columns=columns, filter=expression)
+
+
+def decode_dictionaries(tables: list[pyarrow.Table]) -> list[pyarrow.Table]:
+    """
+    Cast the columns that are dictionary encoded in some of `tables` but stored with another type in
+    others (i.e. seasons cached before dtype compaction) to the dictionary's value type in every
+    table, so the tables can be concatenated. Other columns are unchanged.
+    """
+    types = {}
+    for table in tables:
+        for field in table.schema:
+            types.setdefault(field.name, []).append(field.type)
+    decode = {}
+    for name, col_types in types.items():
+        dictionaries = [t for t in col_types if pyarrow.types.is_dictionary(t)]
+        if len(dictionaries) > 0 and any(t != dictionaries[0] for t in col_types):
+            decode[name] = dictionaries[0].value_type
+    if len(decode) == 0:
+        return tables
+    decoded = []
+    for table in tables:
+        for name, value_type in decode.items():
+            index = table.schema.get_field_index(name)
+            if index != -1 and table.schema.field(index).type != value_type:
+                field = table.schema.field(index).with_type(value_type)
+                column = table.column(index).cast(value_type)
+                table = table.set_column(index, field, column)
+        decoded.append(table)
+    return decoded
+
+
+def read_arrow(
+    path: str, fmt: str, columns: list[str] | None, filters: list | None
+) -> pyarrow.Table:
+    """
+    Read a file or dataset directory as a `pyarrow.Table`. Arrow IPC files are memory mapped, so
+    the table's buffers are backed by the OS page cache rather than copied. A directory holding
+    files of both formats is read one run of files at a time and the runs are concatenated.
+    """
+    if os.path.isdir(path):
+        runs = _runs(path)
+        if len(runs) > 1:
+            tables = [
+                _read_source(files, run_fmt, columns, filters)
+                for run_fmt, files in runs
+            ]
+            return pyarrow.concat_tables(
+                decode_dictionaries(tables), promote_options="permissive"
+            )
+    return _read_source(path, fmt, columns, filters)
+
+
+def _dataset_format(fmt: str) -> str:
+    return "parquet" if fmt == PARQUET else "ipc"
+
+
+def read_schema(path: str, fmt: str) -> pyarrow.Schema:
+    """
+    Schema of a file or dataset directory, read from its metadata only.
+    """
+    if os.path.isdir(path):
+        runs = _runs(path)
+        if len(runs) > 1:
+            schemas = [
+                pyarrow.dataset.dataset(files, format=_dataset_format(run_fmt)).schema
+                for run_fmt, files in runs
+            ]
+            return pyarrow.unify_schemas(schemas, promote_options="permissive")
+    return pyarrow.dataset.dataset(path, format=_dataset_format(fmt)).schema
+
+
+def read(
+    path: str,
+    fmt: str,
+    columns: list[str] | None,
+    filters: list | None,
+    arrow_strings: bool = False,
+) -> pandas.DataFrame:
+    """
+    Read a file or dataset directory as a `DataFrame` (see `read_arrow()`).
+    """
+    return to_pandas(read_arrow(path, fmt, columns, filters), arrow_strings)
+
+
+def _row_groups(series: pandas.Series) -> list[tuple[int, int]]:
+    """
+    `(offset, length)` of each run of equal consecutive values in `series`.
+    """
+    codes, _ = pandas.factorize(series)
+    starts = [0] + list(numpy.flatnonzero(codes[1:] != codes[:-1]) + 1)
+    ends = starts[1:] + [len(codes)]
+    return [(start, end - start) for start, end in zip(starts, ends)]
+
+
+def write_parquet(df: pandas.DataFrame, path: str, schema=None, options: dict = None):
+    """
+    Write `df` as a parquet file with the given encoding options (see `PARQUET_DEFAULTS`). With
+    `row_group_by`, one row group is written per run of equal values of that column (i.e. per game),
+    so readers can skip whole games using the column statistics.
+    """
+    options = {**PARQUET_DEFAULTS, **(options or {})}
+    table = pyarrow.Table.from_pandas(df, schema=schema)
+    with pyarrow.parquet.ParquetWriter(
+        path,
+        table.schema,
+        compression=options["compression"],
+        compression_level=options["compression_level"],
+        use_dictionary=options["use_dictionary"],
+        write_statistics=options["write_statistics"],
+    ) as writer:
+        if options["row_group_by"] in df.columns and len(df) > 0:
+            for offset, length in _row_groups(df[options["row_group_by"]]):
+                writer.write_table(table.slice(offset, length))
+        else:
+            writer.write_table(table, row_group_size=options["row_group_size"])
+
+
+def temporary_path(path: str) -> str:
+    """
+    Temporary file next to `path`, unique to the process and thread writing it. Its name starts
+    with `"."` so dataset readers skip it.
+    """
+    directory, file = os.path.split(path)
+    return os.path.join(
+        directory,
+        "." + file + "." + str(os.getpid()) + "-" + str(threading.get_ident()),
+    )
+
+
+def write(
+    df: pandas.DataFrame,
+    path: str,
+    fmt: str,
+    schema=None,
+    parquet_options: dict = None,
+):
+    """
+    Write `df` to `path` + the extension of `fmt`, removing a copy stored in any other format.
+    The file is written to a temporary file first and moved into place with `os.replace()`, so
+    readers (in any process) see either the previous or the new file but never a partial one. A
+    copy in another format is only removed once the new file is in place.
+    """
+    temp_path = temporary_path(path + EXTENSIONS[fmt])
+    try:
+        if fmt == PARQUET:
+            write_parquet(df, temp_path, schema, parquet_options)
+        else:
+            table = pyarrow.Table.from_pandas(df, schema=schema)
+            pyarrow.feather.write_feather(
+                table, temp_path, compression=ARROW_COMPRESSION[fmt]
+            )
+        os.replace(temp_path, path + EXTENSIONS[fmt])
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    for other in EXTENSIONS.values():
+        if other != EXTENSIONS[fmt] and os.path.exists(path + other):
+            os.remove(path + other)
+
+
+def read_table(path: str) -> pyarrow.Table:
+    """
+    Read a single cache file, of either format, as a `pyarrow.Table`.
+    """
+    if _extension_format(path) == PARQUET:
+        return pyarrow.parquet.read_table(path)
+    return pyarrow.feather.read_table(path)
@@ -0,0 +1,302 @@
+import sqlite3
+import hashlib
+import json
+import time
+import os
+import pandas
+import pyarrow
+from . import formats
+
+
+MDATA_FNAME = "_mdata.sqlite"
+
+LEGACY_TYPES = ["pbp", "schedules", "rosters", "drafts"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS partitions (
+    dataset TEXT NOT NULL,
+    partition TEXT NOT NULL,
+    complete INTEGER NOT NULL,
+    fetched REAL,
+    rows INTEGER,
+    bytes INTEGER,
+    schema_hash TEXT,
+    checksum TEXT,
+    PRIMARY KEY (dataset, partition)
+);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+FIELDS = [
+    "partition",
+    "complete",
+    "fetched",
+    "rows",
+    "bytes",
+    "schema_hash",
+    "checksum",
+]
+
+
+def partition(season: int, week: int = None) -> str:
+    """
+    Metadata key of a season (`"2023"`) or of a week within a season (`"2023/05"`).
+    """
+    key = str(season)
+    if week is not None:
+        key += "/" + str(week).zfill(2)
+    return key
+
+
+def checksum(df: pandas.DataFrame) -> str:
+    """
+    Content checksum of `df` (ignoring the index) used to detect changed partitions.
+    """
+    return str(pandas.util.hash_pandas_object(df, index=False).sum())
+
+
+def schema_hash(df: pandas.DataFrame | pyarrow.Schema) -> str:
+    """
+    Hash of the column names and dtypes of `df`, or of the fields of an Arrow schema.
+    """
+    if isinstance(df, pyarrow.Schema):
+        schema = ",".join(field.name + ":" + str(field.type) for field in df)
+    else:
+        schema = ",".join(str(col) + ":" + str(df[col].dtype) for col in df.columns)
+    return hashlib.sha1(schema.encode()).hexdigest()
+
+
+def _size(path: str) -> int | None:
+    located = formats.locate(path)
+    if located is None:
+        return None
+    path = located[0]
+    if os.path.isdir(path):
+        return sum(
+            os.path.getsize(os.path.join(root, file))
+            for root, _, files in os.walk(path)
+            for file in files
+        )
+    return os.path.getsize(path)
+
+
+def _mdata(row: dict) -> dict:
+    mdata = {field: row[field] for field in FIELDS}
+    mdata["complete"] = bool(mdata["complete"])
+    return mdata
+
+
+def _load_legacy(cache_path: str, mdata_type: str) -> dict:
+    """
+    Load a `_mdata-<type>.json` file written by earlier versions of the cache.
+    """
+    mdata = {}
+    path = cache_path + "_mdata-" + mdata_type + ".json"
+    if os.path.exists(path):
+        with open(path, "r") as file:
+            mdata = json.load(file)
+    return mdata
+
+
+class MdataStore:
+    """
+    Metadata for every partition in a cache directory, stored in a single sqlite database. Each
+    partition keeps its completeness, fetch time, row count, byte size, schema hash and checksum.
+
+    Updates are collected in memory until `commit()` is called and then written in one short
+    transaction, so the database is not locked while data is fetched and dumped, and a store used
+    as a context manager writes all of its updates at once when the `with` block exits.
+
+    ```python
+    >>> with cache.MdataStore("path_to_cache/") as mdata:
+    >>>     mdata.set("pbp", cache.partition(2023), True)
+    ```
+    """
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        os.makedirs(cache_path, exist_ok=True)
+        self.con = sqlite3.connect(cache_path + MDATA_FNAME, timeout=60)
+        self._pending = {}
+        self._pending_settings = {}
+        self.con.executescript(SCHEMA)
+        self.con.commit()
+        self._migrate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self._pending.clear()
+            self._pending_settings.clear()
+        self.close()
+
+    def _migrate(self):
+        """
+        Import and remove the `_mdata-<type>.json` files of earlier versions of the cache.
+        """
+        for mdata_type in LEGACY_TYPES:
+            path = self.cache_path + "_mdata-" + mdata_type + ".json"
+            if not os.path.exists(path):
+                continue
+            mdata = _load_legacy(self.cache_path, mdata_type)
+            for season in mdata:
+                self._upsert(mdata_type, partition(season), mdata[season])
+            self.commit()
+            os.remove(path)
+
+    def _upsert(self, dataset: str, key: str, complete: bool, **fields):
+        row = {
+            "dataset": dataset,
+            "partition": key,
+            "complete": int(bool(complete)),
+            "fetched": None,
+            "rows": None,
+            "bytes": None,
+            "schema_hash": None,
+            "checksum": None,
+        }
+        row.update(fields)
+        self._pending[(dataset, key)] = row
+
+    def set(
+        self,
+        dataset: str,
+        key: str,
+        complete: bool,
+        df: pandas.DataFrame = None,
+        fname: str = None,
+        schema: pyarrow.Schema = None,
+    ):
+        """
+        Record the state of a partition. Row count, schema hash and checksum are taken from `df` and
+        the byte size from the cache file (or directory) `fname` if given.
+
+        Parameters
+        ----------
+
+        dataset : str
+            Dataset name, i.e. `"pbp"`
+
+        key : str
+            Partition key, see `partition()`
+
+        complete : bool
+            Whether the partition is complete and never needs to be refreshed
+
+        df : pandas.DataFrame = None
+            Data stored in the partition
+
+        fname : str = None
+            Cache file name of the partition
+
+        schema : pyarrow.Schema = None
+            Arrow schema the partition was written with. Its hash is recorded instead of the hash of `df`'s dtypes.
+        """
+        fields = {"fetched": time.time()}
+        if df is not None:
+            fields["rows"] = len(df)
+            fields["schema_hash"] = schema_hash(df)
+            fields["checksum"] = checksum(df)
+        if schema is not None:
+            fields["schema_hash"] = schema_hash(schema)
+        if fname is not None:
+            fields["bytes"] = _size(self.cache_path + fname)
+        self._upsert(dataset, key, complete, **fields)
+
+    def get(self, dataset: str, key: str) -> dict | None:
+        """
+        Get the metadata of a single partition or `None` if it is not cached.
+        """
+        if (dataset, key) in self._pending:
+            return _mdata(self._pending[(dataset, key)])
+        row = self.con.execute(
+            "SELECT " + ", ".join(FIELDS) + " FROM partitions "
+            "WHERE dataset = ? AND partition = ?",
+            (dataset, key),
+        ).fetchone()
+        if row is None:
+            return None
+        return _mdata(dict(zip(FIELDS, row)))
+
+    def complete(self, dataset: str, key: str) -> bool | None:
+        """
+        Whether a partition is complete, or `None` if it is not cached.
+        """
+        mdata = self.get(dataset, key)
+        if mdata is None:
+            return None
+        return mdata["complete"]
+
+    def stale(self, dataset: str, key: str, max_staleness: float = 0) -> bool | None:
+        """
+        Whether a partition is incomplete and was fetched more than `max_staleness` seconds ago,
+        or `None` if it is not cached.
+        """
+        mdata = self.get(dataset, key)
+        if mdata is None:
+            return None
+        if mdata["complete"]:
+            return False
+        fetched = mdata["fetched"] or 0
+        return time.time() - fetched > max_staleness
+
+    def partitions(self, dataset: str, prefix: str = "") -> dict[str, dict]:
+        """
+        Get the metadata of every partition of `dataset` whose key starts with `prefix`.
+        """
+        rows = self.con.execute(
+            "SELECT " + ", ".join(FIELDS) + " FROM partitions "
+            "WHERE dataset = ? AND partition LIKE ? ORDER BY partition",
+            (dataset, prefix + "%"),
+        ).fetchall()
+        mdata = {row[0]: _mdata(dict(zip(FIELDS, row))) for row in rows}
+        for (row_dataset, key), row in self._pending.items():
+            if row_dataset == dataset and key.startswith(prefix):
+                mdata[key] = _mdata(row)
+        return dict(sorted(mdata.items()))
+
+    def setting(self, key: str, default: str = None) -> str | None:
+        """
+        Get a cache directory setting, i.e. the storage format.
+        """
+        if key in self._pending_settings:
+            return self._pending_settings[key]
+        row = self.con.execute(
+            "SELECT value FROM settings WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return default
+        return row[0]
+
+    def set_setting(self, key: str, value: str):
+        """
+        Set a cache directory setting.
+        """
+        self._pending_settings[key] = str(value)
+
+    def commit(self):
+        """
+        Write all pending updates in a single transaction.
+        """
+        with self.con:
+            self.con.executemany(
+                "INSERT OR REPLACE INTO partitions VALUES "
+                "(:dataset, :partition, :complete, :fetched, :rows, :bytes, :schema_hash, :checksum)",
+                list(self._pending.values()),
+            )
+            self.con.executemany(
+                "INSERT OR REPLACE INTO settings VALUES (?, ?)",
+                list(self._pending_settings.items()),
+            )
+        self._pending.clear()
+        self._pending_settings.clear()
+
+    def close(self):
+        self.con.close()
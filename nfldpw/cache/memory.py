@@ -0,0 +1,133 @@
+import collections
+import threading
+import pandas
+import pyarrow
+
+
+def _nbytes(data: pandas.DataFrame | pyarrow.Table) -> int:
+    if isinstance(data, pyarrow.Table):
+        return data.nbytes
+    return int(data.memory_usage(index=True, deep=True).sum())
+
+
+def _shallow_copy(data: pandas.DataFrame | pyarrow.Table):
+    if isinstance(data, pyarrow.Table):
+        return data
+    return data.copy(deep=False)
+
+
+class MemoryCache:
+    """
+    Bounded in-process LRU cache of `DataFrame`s and `pyarrow.Table`s loaded by `cache.load()` and
+    `cache.load_table()`. Entries are evicted least
+    recently used first once the total size exceeds `max_bytes`. A `max_bytes` of `0` disables the cache.
+    """
+
+    def __init__(self, max_bytes: int = 0):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes and len(self._entries) > 0:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.nbytes -= nbytes
+            self.evictions += 1
+
+    def get(self, key: tuple) -> pandas.DataFrame | pyarrow.Table | None:
+        """
+        Get the data stored under `key` or `None` if it is not cached.
+        """
+        if self.max_bytes <= 0:
+            return None
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _shallow_copy(self._entries[key][0])
+
+    def put(self, key: tuple, data: pandas.DataFrame | pyarrow.Table):
+        """
+        Store `data` under `key`, evicting the least recently used entries to stay within budget.
+        """
+        if self.max_bytes <= 0:
+            return
+        nbytes = _nbytes(data)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            self._entries[key] = (_shallow_copy(data), nbytes)
+            self.nbytes += nbytes
+            self._evict()
+
+    def invalidate(self, cache_path: str, fname: str):
+        """
+        Drop every entry loaded from the cache file `fname`, or from a dataset directory containing it.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                key_path, key_fname = key[0], key[1]
+                if key_path == cache_path and (
+                    key_fname == fname or fname.startswith(key_fname + "/")
+                ):
+                    self.nbytes -= self._entries.pop(key)[1]
+
+    def resize(self, max_bytes: int):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+MEMORY = MemoryCache()
+
+
+def set_memory_budget(max_bytes: int):
+    """
+    Set the byte budget of the in-process memory cache in front of `cache.load()`. Loads are
+    kept in memory (keyed by cache directory, file, columns and filters) until the budget is
+    exceeded or the file is re-dumped. Entries of files rewritten by another process (detected
+    from their modification time and size) are not served. Pass `0` to disable the memory cache (default).
+
+    Examples
+    --------
+
+        >>> cache.set_memory_budget(2 * 1024**3)
+    """
+    MEMORY.resize(max_bytes)
+
+
+def memory_stats() -> dict:
+    """
+    Hit, miss and eviction counters as well as the current size of the memory cache.
+    """
+    return MEMORY.stats()
+
+
+def clear_memory():
+    """
+    Drop every entry of the memory cache.
+    """
+    MEMORY.clear()
@@ -0,0 +1,146 @@
+import concurrent.futures
+import functools
+import threading
+from .mdata import MdataStore
+from .mdata import partition
+
+
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="nfldpw-revalidate"
+)
+
+_PENDING = {}
+
+_LOCK = threading.Lock()
+
+
+def _done(key: tuple, future: concurrent.futures.Future):
+    with _LOCK:
+        if _PENDING.get(key) is future:
+            del _PENDING[key]
+
+
+def _callback(on_refresh):
+    def callback(future: concurrent.futures.Future):
+        if future.exception() is None:
+            on_refresh(future.result())
+
+    return callback
+
+
+def revalidate(key: tuple, refresh, on_refresh=None) -> concurrent.futures.Future:
+    """
+    Run `refresh()` in the background refresh thread and return its future. If a refresh with the same
+    `key` (i.e. dataset, cache directory and seasons) is still running, no new refresh is started
+    and its future is returned instead. `on_refresh` is called with the result of `refresh()`
+    once it finishes successfully.
+
+    Parameters
+    ----------
+
+    key : tuple
+        Identifies the refresh, i.e. `("pbp", "path_to_cache/", (2024,))`
+
+    refresh : Callable[[], pandas.DataFrame]
+        Re-fetches the stale partitions and returns the refreshed data
+
+    on_refresh : Callable[[pandas.DataFrame], None] = None
+        Callback receiving the refreshed data
+
+    Returns
+    -------
+
+        out : concurrent.futures.Future
+    """
+    with _LOCK:
+        future = _PENDING.get(key)
+        if future is None:
+            future = _EXECUTOR.submit(refresh)
+            _PENDING[key] = future
+            future.add_done_callback(lambda done: _done(key, done))
+    if on_refresh is not None:
+        future.add_done_callback(_callback(on_refresh))
+    return future
+
+
+def classify(
+    mdata: MdataStore,
+    dataset: str,
+    seasons: list[int],
+    update_last_season: bool = False,
+    max_staleness: float = 0,
+    background: bool = False,
+) -> tuple[list[int], list[int]]:
+    """
+    Split the `seasons` of a dataset into those to fetch now, because they are not cached or are
+    stale and reloaded in the foreground, and those that are stale and reloaded in the background
+    (see `revalidate_seasons()`). Stale seasons are only reloaded with `update_last_season`.
+
+    Returns
+    -------
+
+        out : tuple[list[int], list[int]]
+            Missing and stale seasons
+    """
+    missing = []
+    stale = []
+    for season in seasons:
+        is_stale = mdata.stale(dataset, partition(season), max_staleness)
+        if is_stale is None:
+            missing.append(season)
+        elif is_stale and update_last_season:
+            if background:
+                stale.append(season)
+            else:
+                missing.append(season)
+    return missing, stale
+
+
+def revalidate_seasons(
+    get,
+    dataset: str,
+    seasons: list[int],
+    cache_path: str,
+    columns: list[str] | None,
+    filters: list | None,
+    arrow_strings: bool,
+    as_arrow: bool,
+    max_staleness: float,
+    on_refresh=None,
+) -> concurrent.futures.Future:
+    """
+    `revalidate()` a dataset's `get()`, reloading the stale `seasons` with `update_last_season` and
+    the same columns, filters and output options. Refreshes of the same call are deduplicated.
+    """
+    return revalidate(
+        (
+            dataset,
+            cache_path,
+            tuple(seasons),
+            repr(columns),
+            repr(filters),
+            arrow_strings,
+            as_arrow,
+        ),
+        functools.partial(
+            get,
+            seasons,
+            cache_path,
+            True,
+            columns,
+            filters,
+            arrow_strings,
+            as_arrow,
+            max_staleness,
+        ),
+        on_refresh,
+    )
+
+
+def wait_for_refreshes(timeout: float = None):
+    """
+    Block until every background refresh started by a `get(..., background=True)` has finished.
+    """
+    with _LOCK:
+        futures = list(_PENDING.values())
+    concurrent.futures.wait(futures, timeout)
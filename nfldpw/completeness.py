@@ -0,0 +1,189 @@
+"""
+===================
+Season completeness
+===================
+
+A season is complete once its Super Bowl has been played, which is read from the schedules data
+(the `game_type == "SB"` game has a result). Cached schedules are used when available and missing
+ones are fetched in a single call, so no extra requests are made per season. Complete seasons are
+memoized for the lifetime of the process. The Wikipedia Super Bowl dates (`sbowls`) are only used
+as a fallback when the schedules data has no Super Bowl for a season.
+"""
+
+import datetime
+import pandas
+from . import cache
+from . import sbowls
+from . import schedules
+
+
+_COMPLETE = set()
+
+
+def _schedule_columns() -> list:
+    return [
+        schedules.cols.Season,
+        schedules.cols.GameType,
+        schedules.cols.Gameday,
+        schedules.cols.Result,
+    ]
+
+
+def superbowl_played(
+    schedule: pandas.DataFrame,
+    days_after: int = 0,
+    today: datetime.datetime = None,
+    superbowl_date: datetime.datetime = None,
+) -> bool | None:
+    """
+    Whether the Super Bowl in the schedules data of a season has a result and was played at least
+    `days_after` days ago. Returns `None` if it cannot be decided from `schedule`, i.e. the season
+    has no Super Bowl game or it should have been played already but has no result yet (the
+    schedule is out of date). A season without a Super Bowl game whose `superbowl_date` (see
+    `sbowls`) is still ahead, i.e. during the regular season, is not complete.
+    """
+    today = today or datetime.datetime.today()
+    game_type = schedule[schedules.cols.GameType.header].astype(str)
+    sbowl = schedule[game_type == schedules.cols.GameType.SB]
+    if len(sbowl) == 0:
+        if superbowl_date is not None and today < superbowl_date:
+            return False
+        return None
+    gameday = pandas.to_datetime(sbowl[schedules.cols.Gameday.header].iloc[0])
+    if pandas.isna(sbowl[schedules.cols.Result.header].iloc[0]):
+        if gameday < today:
+            return None
+        return False
+    return gameday + datetime.timedelta(days_after) <= today
+
+
+def _cached_schedule(season: int, cache_path: str) -> pandas.DataFrame | None:
+    if not cache_path or not cache.exists(cache_path, cache.fname_schedules(season)):
+        return None
+    return cache.load(
+        cache_path,
+        cache.fname_schedules(season),
+        cache.headers(_schedule_columns()),
+    )
+
+
+def _superbowl_date(season: int, cache_path: str) -> datetime.datetime | None:
+    for date in sbowls.load_superbowl_dates(cache_path):
+        if date.year - 1 == season:
+            return date
+    return None
+
+
+def _superbowl_dates_complete(season: int, cache_path: str, days_after: int) -> bool:
+    """
+    Fallback using the Super Bowl dates scraped from Wikipedia.
+    """
+    date = _superbowl_date(season, cache_path)
+    if date is None:
+        return False
+    return date + datetime.timedelta(days_after) <= datetime.datetime.today()
+
+
+def schedule_complete(
+    schedule: pandas.DataFrame,
+    season: int,
+    cache_path: str = None,
+    days_after: int = 0,
+) -> bool:
+    """
+    Whether `season` is complete according to its freshly fetched schedules data, falling back to
+    the Wikipedia Super Bowl dates if the schedule has no Super Bowl result.
+    """
+    if (season, days_after) in _COMPLETE:
+        return True
+    played = superbowl_played(schedule, days_after)
+    if played is None:
+        played = _superbowl_dates_complete(season, cache_path, days_after)
+    if played:
+        _COMPLETE.add((season, days_after))
+    return played
+
+
+def seasons_complete(
+    seasons: list[int], cache_path: str = None, days_after: int = 0
+) -> dict[int, bool]:
+    """
+    Whether each of `seasons` is complete, i.e. its Super Bowl was played at least `days_after`
+    days ago.
+
+    Parameters
+    ----------
+
+    seasons : list[int]
+        Seasons to check
+
+    cache_path : str = None
+        Path to a directory where cache files are stored. Cached schedules are read from it and
+        schedules that are missing or out of date are stored in it.
+
+    days_after : int = 0
+        Number of days after the Super Bowl from which a season is considered complete
+
+    Returns
+    -------
+
+        out : dict[int, bool]
+    """
+    complete = {}
+    unknown = []
+    for season in dict.fromkeys(seasons):
+        if (season, days_after) in _COMPLETE:
+            complete[season] = True
+            continue
+        schedule = _cached_schedule(season, cache_path)
+        played = None
+        if schedule is not None:
+            played = superbowl_played(
+                schedule,
+                days_after,
+                superbowl_date=_superbowl_date(season, cache_path),
+            )
+        if played is None:
+            unknown.append(season)
+        else:
+            complete[season] = played
+    if len(unknown) > 0:
+        schedule = schedules.get(unknown, cache_path, True, columns=_schedule_columns())
+        for season in unknown:
+            complete[season] = schedule_complete(
+                schedule[schedule[schedules.cols.Season.header] == season],
+                season,
+                cache_path,
+                days_after,
+            )
+    for season in complete:
+        if complete[season]:
+            _COMPLETE.add((season, days_after))
+    return complete
+
+
+def has_superbowl(game_ids: pandas.Series, season: int, cache_path: str = None) -> bool:
+    """
+    Whether the game IDs of a season's data (i.e. the play-by-play data) include the season's Super
+    Bowl game, so data fetched right after the game but before it was published is not taken as
+    complete. `True` if the Super Bowl game is not known from the cached schedules data.
+    """
+    if not cache_path or not cache.exists(cache_path, cache.fname_schedules(season)):
+        return True
+    schedule = cache.load(
+        cache_path,
+        cache.fname_schedules(season),
+        cache.headers([schedules.cols.GameType, schedules.cols.GameId]),
+    )
+    game_type = schedule[schedules.cols.GameType.header].astype(str)
+    sbowl = schedule[game_type == schedules.cols.GameType.SB]
+    if len(sbowl) == 0:
+        return True
+    return sbowl[schedules.cols.GameId.header].iloc[0] in set(game_ids)
+
+
+def season_complete(season: int, cache_path: str = None, days_after: int = 0) -> bool:
+    """
+    Whether `season` is complete, see `seasons_complete()`.
+    """
+    return seasons_complete([season], cache_path, days_after)[season]
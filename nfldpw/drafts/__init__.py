@@ -3,7 +3,7 @@
 Drafts data
 =================
 
-Use `get()` for general NFL draft data.
+Use `get()` (or the awaitable `aget()`) for general NFL draft data.
 
 Available submodules
 --------------------
@@ -16,6 +16,19 @@ cols:
 
 """
 
+import importlib
 from .drafts import get
-from . import cols
-from .drafts import EXTRA_DRAFT_ID
\ No newline at end of file
+from .drafts import aget
+from .drafts import EXTRA_DRAFT_ID
+
+
+LAZY_SUBMODULES = ["cols"]
+
+
+def __getattr__(name: str):
+    """
+    Import the submodules in `LAZY_SUBMODULES` on first access.
+    """
+    if name in LAZY_SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
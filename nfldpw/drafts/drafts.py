@@ -1,66 +1,31 @@
-import nfl_data_py
-from . import cols
 import pandas
+import pyarrow
 from .. import cache
+from .. import extra_id
+from ..extra_id import EXTRA_DRAFT_ID
 
 
-EXTRA_DRAFT_ID = "extra_ID"
+RENAME_MAP = {
+    "cfb_player_id": "cfbref_id",
+    "pfr_player_id": "pfr_id",
+}
 
 
 def _create_extra_ID(df: pandas.DataFrame) -> pandas.DataFrame:
     """
-    Create the extra draft ID.
-
-    -----
-    Style
-    -----
-
-    id = [Draft Team][Draft Number Ovr (i.e. `round * pick`)][Full Name]
-
-    Notes
-    -----
-
-    * In [Full Name], "." is replaced by "_" and " " is replaced by "-".
-
-    * Depending on when a player was drafted, their Draft ID may show up with outdated team abbreviations (e.i. "STL", "SD", etc.).
-    However, this should **_not_** be cause for concern as most sources where Draft IDs are generated from are consistent with the outdated
-    team abbreviations.
-
-    -------
-    Example
-    -------
-
-    E.J. Henderson: Drafted 40th overall by the Minnesoda Vikings
-
-    `MIN40E_J_-Henderson`
-
-    ------------
-    Known Issues
-    ------------
-
-    * Some sources might stylize E.J. Henderson's name as "Eric Henderson".
-    In this case the auto-generated draft ID would be created as `MIN40Eric-Henderson` and will not
-    match when compared against `MIN40E_J_-Henderson`.
-
-    * Additionally, as it might be apparent, Draft ID is not 100% unique, but rather an auto-generated ID used to assist
-    in matching players between different data sources. Inappropriate matches may occur, although they should be very rare.
-
+    Add the extra draft ID (see `nfldpw.extra_id`).
     """
-    picklesseq32 = df[cols.Pick.header] <= 32
-    pick_num = (picklesseq32 * df[cols.Round.header] * df[cols.Pick.header]) + (
-        (~picklesseq32) * df[cols.Pick.header]
-    )
-    df[EXTRA_DRAFT_ID] = (
-        df[cols.Team.header]
-        + (pick_num).apply(str)
-        + df[cols.PfrPlayerName.header]
-        .str.replace(" ", "-", regex=False)
-        .str.replace(".", "_", regex=False)
+    from . import cols
+
+    ids = extra_id.extra_id(
+        df[cols.Team.header],
+        extra_id.overall_pick(df[cols.Round.header], df[cols.Pick.header]),
+        [df[cols.PfrPlayerName.header]],
     )
-    return df
+    return extra_id.assign(df, ids)
 
 
-def _draft_cols_rename(df: pandas.DataFrame) -> pandas.DataFrame:
+def _draft_cols_rename(table: pyarrow.Table) -> pyarrow.Table:
     """
     Rename draft columns for consistency.
 
@@ -71,20 +36,48 @@ def _draft_cols_rename(df: pandas.DataFrame) -> pandas.DataFrame:
 
     `"pfr_player_id" -> "pfr_id"`
     """
-    RENAME_MAP = {
-        "cfb_player_id": "cfbref_id",
-        "pfr_player_id": "pfr_id",
-    }
-    df = df.rename(RENAME_MAP, axis="columns")
-    return df
+    return table.rename_columns(
+        [RENAME_MAP.get(name, name) for name in table.column_names]
+    )
 
 
-def get(seasons: list[int], cache_path: str = None) -> pandas.DataFrame:
+def _source_columns(columns: list[str] | None) -> list[str] | None:
+    """
+    Map the requested columns back to the columns stored in the cache, i.e. undo `_draft_cols_rename()`.
+    """
+    if columns is None:
+        return None
+    inverse = {new: old for old, new in RENAME_MAP.items()}
+    return [inverse.get(col, col) for col in columns]
+
+
+def _fetch_seasons(seasons: list[int]) -> dict[int, pandas.DataFrame]:
+    """
+    Fetch `seasons` with a single download of the upstream file (which covers every season) and
+    split it into one frame per season. The extra draft ID is added so that it is stored in the cache.
+    """
+    if len(seasons) == 0:
+        return {}
+    import nfl_data_py
+    from . import cols
+
+    df = _create_extra_ID(cache.compact(nfl_data_py.import_draft_picks(seasons), cols))
+    return cache.split_seasons(df, seasons, cols.Season.header)
+
+
+def get(
+    seasons: list[int],
+    cache_path: str = None,
+    columns: list = None,
+    arrow_strings: bool = None,
+    as_arrow: bool = False,
+) -> pandas.DataFrame | pyarrow.Table:
     """
     Get draft data for the list of seasons provided.
     If a cache path is provided, data will be read from the cache
     or stored in the cache if calling for the first time. Otherwise,
     data is loaded from the web source.
+    Seasons missing from the cache are fetched from the web source in a single download.
 
     Parameters
     ----------
@@ -95,38 +88,71 @@ def get(seasons: list[int], cache_path: str = None) -> pandas.DataFrame:
     cache_path : str = None
         Path to a directory where cache files are stored.
 
+    columns : list = None
+        Columns to load, given as header strings or `cols` classes. All columns are loaded if `None`.
+
+    arrow_strings : bool = None
+        Whether string columns are returned as Arrow-backed `string[pyarrow]` instead of Python objects.
+        Defaults to `cache.set_arrow_strings()` (`True`).
+
+    as_arrow : bool = False
+        Whether to return the assembled `pyarrow.Table` instead of converting it to pandas.
+
     Returns
     -------
 
-        out : pandas.DataFrame
+        out : pandas.DataFrame | pyarrow.Table
 
     Examples
     --------
 
         >>> drafts.get([2020, 2021, 2022], "path_to_cache/")
     """
-    dfs = []
+    columns = cache.headers(columns)
+    source_columns = _source_columns(columns)
+    arrow_strings = cache.use_arrow_strings(arrow_strings)
+    tables = []
     if cache_path:
-        mdata = cache.load_drafts_mdata(cache_path)
-        dfs = []
-        for season in seasons:
-            from_cache = True
-            if season not in mdata:
-                from_cache = False
-            if from_cache:
-                dfs.append(cache.load(cache_path, cache.fname_drafts(season)))
-            else:
-                df = nfl_data_py.import_draft_picks([season])
-                if len(df) > 0:
-                    mdata[season] = True
-                    cache.dump(df, cache_path, cache.fname_drafts(season))
-                    cache.dump_drafts_mdata(mdata, cache_path)
-                    dfs.append(df)
+        with cache.MdataStore(cache_path) as mdata:
+            missing = []
+            for season in seasons:
+                if mdata.complete("drafts", cache.partition(season)) is None:
+                    missing.append(season)
+            fetched = _fetch_seasons(missing)
+            for season in seasons:
+                if season in fetched:
+                    df = fetched[season]
+                    if len(df) > 0:
+                        fname = cache.fname_drafts(season)
+                        cache.dump(df, cache_path, fname)
+                        mdata.set("drafts", cache.partition(season), True, df, fname)
+                        tables.append(cache.to_table(df, columns=source_columns))
+                else:
+                    fname = cache.fname_drafts(season)
+                    cache.upgrade_column(
+                        cache_path, fname, EXTRA_DRAFT_ID, _create_extra_ID
+                    )
+                    tables.append(cache.load_table(cache_path, fname, source_columns))
 
     else:
+        fetched = _fetch_seasons(seasons)
         for season in seasons:
-            dfs.append(nfl_data_py.import_draft_picks([season]))
-    df = pandas.concat(dfs)
-    df = _draft_cols_rename(df)
-    df = _create_extra_ID(df)
-    return df
+            tables.append(cache.to_table(fetched[season], columns=source_columns))
+    table = _draft_cols_rename(cache.concat_tables(tables))
+    if columns is not None:
+        table = table.select(columns)
+    return cache.output(table, as_arrow, arrow_strings)
+
+
+async def aget(*args, **kwargs) -> pandas.DataFrame | pyarrow.Table:
+    """
+    Awaitable `get()` taking the same parameters. Cache reads and web fetches run in a worker
+    thread so the event loop is not blocked, and several calls (of any dataset) may be awaited
+    concurrently, bounded by `cache.set_async_limit()`.
+
+    Examples
+    --------
+
+        >>> dfs = await asyncio.gather(drafts.aget([2022], "path_to_cache/"), drafts.aget([2023], "path_to_cache/"))
+    """
+    return await cache.run_async(get, *args, **kwargs)
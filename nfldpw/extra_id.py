@@ -0,0 +1,153 @@
+"""
+==============
+Extra draft ID
+==============
+
+-----
+Style
+-----
+
+id = [Draft Team][Draft Number Ovr (i.e. `round * pick`)][Full Name]
+
+Notes
+-----
+
+* In [Full Name], "." is replaced by "_" and " " is replaced by "-".
+
+* Depending on when a player was drafted, their Draft ID may show up with outdated team abbreviations (e.i. "STL", "SD", etc.).
+However, this should **_not_** be cause for concern as most sources where Draft IDs are generated from are consistent with the outdated
+team abbreviations.
+
+-------
+Example
+-------
+
+E.J. Henderson: Drafted 40th overall by the Minnesoda Vikings
+
+`MIN40E_J_-Henderson`
+
+------------
+Known Issues
+------------
+
+* Some sources might stylize E.J. Henderson's name as "Eric Henderson".
+In this case the auto-generated draft ID would be created as `MIN40Eric-Henderson` and will not
+match when compared against `MIN40E_J_-Henderson`.
+
+* Additionally, as it might be apparent, Draft ID is not 100% unique, but rather an auto-generated ID used to assist
+in matching players between different data sources. Inappropriate matches may occur, although they should be very rare.
+
+----------
+Processing
+----------
+
+The ID is built with Arrow compute kernels (no per-row Python calls) once, when a dataset is fetched, and is
+stored in the cached partitions alongside the columns it is created from.
+"""
+
+import pandas
+import pyarrow
+import pyarrow.compute
+from .cache.formats import ARROW_STRING
+
+
+EXTRA_DRAFT_ID = "extra_ID"
+
+
+def _array(values: pandas.Series | pyarrow.Array) -> pyarrow.Array:
+    if isinstance(values, pandas.Series):
+        return pyarrow.array(values, from_pandas=True)
+    return values
+
+
+def _string(array: pyarrow.Array) -> pyarrow.Array:
+    return pyarrow.compute.cast(array, pyarrow.string())
+
+
+def _name(array: pyarrow.Array) -> pyarrow.Array:
+    array = pyarrow.compute.replace_substring(_string(array), " ", "-")
+    return pyarrow.compute.replace_substring(array, ".", "_")
+
+
+def _number(
+    array: pyarrow.Array, missing_number: str | None, zero_is_missing: bool
+) -> pyarrow.Array:
+    """
+    Converts `WXY.Z` to `"WXY"`, and missing values (and `0` if `zero_is_missing`) to `missing_number`.
+    """
+    number = pyarrow.compute.round(pyarrow.compute.cast(array, pyarrow.float64()))
+    missing = pyarrow.compute.is_null(number, nan_is_null=True)
+    if zero_is_missing:
+        missing = pyarrow.compute.or_kleene(missing, pyarrow.compute.equal(number, 0))
+    number = pyarrow.compute.if_else(missing, 0, number)
+    return pyarrow.compute.if_else(
+        missing,
+        pyarrow.scalar(missing_number, pyarrow.string()),
+        _string(pyarrow.compute.cast(number, pyarrow.int64())),
+    )
+
+
+def overall_pick(
+    round: pandas.Series | pyarrow.Array, pick: pandas.Series | pyarrow.Array
+) -> pyarrow.Array:
+    """
+    Overall draft number from the round and pick columns of the drafts data, i.e. `round * pick` for
+    picks given within their round (`pick <= 32`).
+    """
+    pick = _array(pick)
+    return pyarrow.compute.if_else(
+        pyarrow.compute.less_equal(pick, 32),
+        pyarrow.compute.multiply(_array(round), pick),
+        pick,
+    )
+
+
+def extra_id(
+    team: pandas.Series | pyarrow.Array,
+    number: pandas.Series | pyarrow.Array,
+    names: list[pandas.Series | pyarrow.Array],
+    missing_number: str | None = None,
+    zero_is_missing: bool = False,
+) -> pyarrow.Array:
+    """
+    Build the extra draft ID of each row.
+
+    Parameters
+    ----------
+
+    team : pandas.Series | pyarrow.Array
+        Drafting team. The ID is missing where it is missing.
+
+    number : pandas.Series | pyarrow.Array
+        Overall draft number
+
+    names : list[pandas.Series | pyarrow.Array]
+        Parts of the full name, joined by "-" (i.e. first and last name)
+
+    missing_number : str | None = None
+        Written in place of a missing draft number. The ID is missing where the draft number is missing if `None`.
+
+    zero_is_missing : bool = False
+        Whether a draft number of `0` is considered missing
+
+    Returns
+    -------
+
+        out : pyarrow.Array
+    """
+    names = [_name(_array(name)) for name in names]
+    full_name = pyarrow.compute.binary_join_element_wise(*names, "-")
+    return pyarrow.compute.binary_join_element_wise(
+        _string(_array(team)),
+        _number(_array(number), missing_number, zero_is_missing),
+        full_name,
+        "",
+    )
+
+
+def assign(df: pandas.DataFrame, ids: pyarrow.Array) -> pandas.DataFrame:
+    """
+    Add the IDs built by `extra_id()` to `df` as its `EXTRA_DRAFT_ID` column.
+    """
+    values = ids.to_pandas(types_mapper={pyarrow.string(): ARROW_STRING}.get)
+    return df.assign(**{EXTRA_DRAFT_ID: pandas.Series(values.array, index=df.index)})
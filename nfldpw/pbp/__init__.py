@@ -3,7 +3,7 @@
 Play-by-play data
 =================
 
-Use `get()` for general NFL play-by-play data.
+Use `get()` (or the awaitable `aget()`) for general NFL play-by-play data.
 
 Available submodules
 --------------------
@@ -16,5 +16,19 @@ cols:
 
 """
 
+import importlib
 from .pbp import get
-from . import cols
+from .pbp import aget
+from .pbp import iter_seasons
+
+
+LAZY_SUBMODULES = ["cols"]
+
+
+def __getattr__(name: str):
+    """
+    Import the submodules in `LAZY_SUBMODULES` on first access.
+    """
+    if name in LAZY_SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
@@ -1,24 +1,83 @@
-import nfl_data_py
 import pandas
+import pyarrow
+import os
+import functools
+from typing import Iterator
 from .. import cache
-from .. import sbowls
+from .. import completeness
 
 
-def _season_complete(df: pandas.DataFrame, cache_path: str) -> bool:
-    sb_dates = sbowls.load_superbowl_dates(cache_path)
-    sb_cands = pandas.to_datetime(df["game_date"]).isin(sb_dates).sum()
-    complete = sb_cands > 0
-    return complete
+def _fetch_season(season: int, columns: list[str] = None) -> pandas.DataFrame:
+    import nfl_data_py
+    from . import cols
+
+    return cache.compact(nfl_data_py.import_pbp_data([season], columns), cols)
+
+
+def _dump_weeks(
+    df: pandas.DataFrame,
+    cache_path: str,
+    season: int,
+    mdata: cache.MdataStore,
+    complete: bool,
+):
+    """
+    Write the weeks of a season's play-by-play data that are new or have changed since they were
+    last cached and record them in `mdata`. Every week is rewritten if the schema of the season has
+    changed (i.e. a column that was all missing in the earlier weeks), so that the weeks of a season
+    can always be read as one dataset. A week is complete once a later week has started or the
+    season is complete and its Super Bowl game is in `df`.
+    """
+    from . import cols
+
+    complete = complete and completeness.has_superbowl(
+        df[cols.GameId.header], season, cache_path
+    )
+    weeks = mdata.partitions("pbp", cache.partition(season) + "/")
+    legacy_path = cache_path + cache.fname_pbp_legacy(season) + ".parq"
+    schema = pyarrow.Schema.from_pandas(df, preserve_index=False)
+    schema_hash = cache.schema_hash(schema)
+    last_week = df[cols.Week.header].max()
+    for week, week_df in df.groupby(cols.Week.header, sort=True):
+        week = int(week)
+        key = cache.partition(season, week)
+        fname = cache.fname_pbp(season, week)
+        week_df = week_df.reset_index(drop=True)
+        week_complete = complete or week < last_week
+        if (
+            key not in weeks
+            or weeks[key]["schema_hash"] != schema_hash
+            or weeks[key]["checksum"] != cache.checksum(week_df)
+        ):
+            cache.dump(week_df, cache_path, fname, schema)
+            mdata.set("pbp", key, week_complete, week_df, fname, schema)
+        elif week_complete != weeks[key]["complete"]:
+            mdata.set("pbp", key, week_complete, week_df, fname, schema)
+    if os.path.exists(legacy_path):
+        os.remove(legacy_path)
+    mdata.set(
+        "pbp", cache.partition(season), complete, df, cache.fname_pbp(season), schema
+    )
 
 
 def get(
-    seasons: list[int], cache_path: str = None, update_last_season: bool = False
-) -> pandas.DataFrame:
+    seasons: list[int],
+    cache_path: str = None,
+    update_last_season: bool = False,
+    columns: list = None,
+    filters: dict | list = None,
+    arrow_strings: bool = None,
+    as_arrow: bool = False,
+    max_staleness: float = 0,
+    background: bool = False,
+    on_refresh=None,
+) -> pandas.DataFrame | pyarrow.Table:
     """
     Get play-by-play data for the list of seasons provided.
     If a cache path is provided, data will be read from the cache
     or stored in the cache if calling for the first time. Otherwise,
     data is loaded from the web source.
+    Seasons are fetched from the web source concurrently (see `cache.set_fetch_workers()`).
 
     Parameters
     ----------
@@ -30,42 +89,144 @@ def get(
         Path to a directory where cache files are stored
 
     update_last_season : bool = False
-        Whether cached seasons that are incomplete should be reloaded (i.e. after a new week has ended). 
+        Whether cached seasons that are incomplete should be reloaded (i.e. after a new week has ended).
+        Only the weeks that are new or have changed are rewritten to the cache.
+
+    columns : list = None
+        Columns to load, given as header strings or `cols` classes. All columns are loaded if `None`.
+
+    filters : dict | list = None
+        Row filters pushed down into the cache read, i.e. `{cols.Week: 5, cols.PlayType: cols.PlayType.PASS}`
+        or `[(cols.Week, ">=", 5)]`. See `cache.predicates()` for the accepted forms.
+
+    arrow_strings : bool = None
+        Whether string columns are returned as Arrow-backed `string[pyarrow]` instead of Python objects.
+        Defaults to `cache.set_arrow_strings()` (`True`).
+
+    as_arrow : bool = False
+        Whether to return the assembled `pyarrow.Table` instead of converting it to pandas.
+
+    max_staleness : float = 0
+        Seconds for which a cached incomplete season is considered fresh. `update_last_season` only reloads
+        seasons fetched longer ago than this.
+
+    background : bool = False
+        Stale-while-revalidate: with `update_last_season`, return the cached copy of incomplete seasons immediately
+        and reload them in a background thread (see `cache.wait_for_refreshes()`).
+
+    on_refresh : Callable[[pandas.DataFrame], None] = None
+        Called with the refreshed result (same seasons, columns and filters) once a background reload has finished.
 
     Returns
     -------
 
-        out : pandas.DataFrame
+        out : pandas.DataFrame | pyarrow.Table
 
     Examples
     --------
 
         >>> pbp.get([2020, 2021, 2022], "path_to_cache/")
     """
-    dfs = []
+    columns = cache.headers(columns)
+    filters = cache.predicates(filters)
+    arrow_strings = cache.use_arrow_strings(arrow_strings)
+    tables = []
     if cache_path:
-        mdata = cache.load_pbp_mdata(cache_path)
-        dfs = []
-        for season in seasons:
-            from_cache = True
-            if season in mdata:
-                if not mdata[season] and update_last_season:
-                    from_cache = False
-            else:
-                from_cache = False
-            if from_cache:
-                dfs.append(cache.load(cache_path, cache.fname_pbp(season)))
-            else:
-                df = nfl_data_py.import_pbp_data([season])
-                if _season_complete(df, cache_path):
-                    mdata[season] = True
+        with cache.MdataStore(cache_path) as mdata:
+            missing, stale = cache.classify(
+                mdata, "pbp", seasons, update_last_season, max_staleness, background
+            )
+            fetched = cache.fetch(_fetch_season, missing)
+            complete = completeness.seasons_complete(list(fetched), cache_path)
+            for season in seasons:
+                if season in fetched:
+                    df = fetched[season]
+                    _dump_weeks(df, cache_path, season, mdata, complete[season])
+                    tables.append(cache.to_table(df, filters, columns))
                 else:
-                    mdata[season] = False
-                cache.dump(df, cache_path, cache.fname_pbp(season))
-                cache.dump_pbp_mdata(mdata, cache_path)
-                dfs.append(df)
+                    fname = cache.fname_pbp(season)
+                    if not os.path.isdir(cache_path + fname):
+                        fname = cache.fname_pbp_legacy(season)
+                    tables.append(cache.load_table(cache_path, fname, columns, filters))
 
+        if len(stale) > 0:
+            cache.revalidate_seasons(
+                get,
+                "pbp",
+                seasons,
+                cache_path,
+                columns,
+                filters,
+                arrow_strings,
+                as_arrow,
+                max_staleness,
+                on_refresh,
+            )
     else:
+        fetched = cache.fetch(
+            functools.partial(
+                _fetch_season, columns=cache.read_columns(columns, filters)
+            ),
+            seasons,
+        )
         for season in seasons:
-            dfs.append(nfl_data_py.import_pbp_data([season]))
-    return pandas.concat(dfs)
+            tables.append(cache.to_table(fetched[season], filters, columns))
+    return cache.output(cache.concat_tables(tables), as_arrow, arrow_strings)
+
+
+async def aget(*args, **kwargs) -> pandas.DataFrame | pyarrow.Table:
+    """
+    Awaitable `get()` taking the same parameters. Cache reads and web fetches run in a worker
+    thread so the event loop is not blocked, and several calls (of any dataset) may be awaited
+    concurrently, bounded by `cache.set_async_limit()`.
+
+    Examples
+    --------
+
+        >>> dfs = await asyncio.gather(pbp.aget([2022], "path_to_cache/"), pbp.aget([2023], "path_to_cache/"))
+    """
+    return await cache.run_async(get, *args, **kwargs)
+
+
+def iter_seasons(
+    seasons: list[int],
+    cache_path: str = None,
+    update_last_season: bool = False,
+    columns: list = None,
+    filters: dict | list = None,
+    arrow_strings: bool = None,
+    chunk=None,
+) -> Iterator[pandas.DataFrame]:
+    """
+    Iterate over play-by-play data one season (or one chunk of a season) at a time, so that only a single
+    season is held in memory. Takes the same parameters as `get()`, as well as `chunk`.
+
+    Parameters
+    ----------
+
+    chunk : str | cols class = None
+        Column to split each season by, i.e. `cols.Week.header` or `cols.GameId.header`. Whole seasons are yielded if `None`.
+
+    Returns
+    -------
+
+        out : Iterator[pandas.DataFrame]
+
+    Examples
+    --------
+
+        >>> for week_df in pbp.iter_seasons(range(1999, 2025), "path_to_cache/", columns=[cols.Epa], chunk=cols.Week):
+        >>>     ...
+    """
+    columns = cache.headers(columns)
+    chunk = None if chunk is None else cache.headers([chunk])[0]
+    for season in seasons:
+        df = get(
+            [season],
+            cache_path,
+            update_last_season,
+            cache.chunk_columns(columns, chunk),
+            filters,
+            arrow_strings,
+        )
+        yield from cache.iter_chunks(df, chunk, columns)
@@ -3,7 +3,7 @@
 Players data
 =================
 
-Use `get()` for general NFL players data.
+Use `get()` (or the awaitable `aget()`) for general NFL players data.
 
 Available submodules
 --------------------
@@ -16,6 +16,18 @@ cols:
 
 """
 
+import importlib
 from .players import get
-from . import cols
-from . import ids
+from .players import aget
+
+
+LAZY_SUBMODULES = ["cols", "ids"]
+
+
+def __getattr__(name: str):
+    """
+    Import the submodules in `LAZY_SUBMODULES` on first access.
+    """
+    if name in LAZY_SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
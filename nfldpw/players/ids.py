@@ -6,15 +6,15 @@ Players IDs
 Use of `IDMap` is recommended rather than `IDKeeper`.
 """
 
+import numpy
 import pandas
+import pyarrow
 import os
-import nfl_data_py
 from .. import cache
 from .. import players
 from .. import drafts
 from .. import rosters
 from ..drafts import EXTRA_DRAFT_ID
-import tqdm
 import datetime
 
 
@@ -42,32 +42,98 @@ KTC = "ktc_id"
 SWISH = "swish_id"
 
 DTYPE_LIST = {
-    YAHOO: "float64",
+    YAHOO: "Int64",
     ESB: "object",
     SMART: "object",
     NFL: "object",
-    ESPN: "float64",
-    ROTOWORLD: "float64",
+    ESPN: "Int64",
+    ROTOWORLD: "Int64",
     GSIS: "object",
-    SLEEPER: "float64",
-    STATS: "float64",
+    SLEEPER: "Int64",
+    STATS: "Int64",
     SPORTRADAR: "object",
-    CBS: "float64",
-    STATS_GLOBAL: "float64",
+    CBS: "Int64",
+    STATS_GLOBAL: "Int64",
     CFBREF: "object",
-    FLEAFLICKER: "float64",
-    FANTASYPROS: "float64",
-    FANTASY_DATA: "float64",
-    PFF: "float64",
-    MFL: "float64",
+    FLEAFLICKER: "Int64",
+    FANTASYPROS: "Int64",
+    FANTASY_DATA: "Int64",
+    PFF: "Int64",
+    MFL: "Int64",
     PFR: "object",
-    ROTOWIRE: "float64",
-    KTC: "float64",
-    SWISH: "float64",
+    ROTOWIRE: "Int64",
+    KTC: "Int64",
+    SWISH: "Int64",
     EXTRA_DRAFT_ID: "object",
 }
 
 
+def _string_ids(series: pandas.Series) -> pandas.Series:
+    if pandas.api.types.is_numeric_dtype(series.dtype):
+        numbers = series.round().astype("Int64")
+        series = numbers.astype(str).where(numbers.notna())
+    return series.astype("object")
+
+
+def typed(df: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Cast the ID columns of `df` to their type in `DTYPE_LIST`: integer IDs to nullable `Int64` and string IDs to
+    Python strings. Other columns are left as they are.
+    """
+    ids = {}
+    for id in df.columns.intersection(list(DTYPE_LIST)):
+        if DTYPE_LIST[id] == "Int64":
+            numbers = pandas.to_numeric(df[id], errors="coerce")
+            ids[id] = numbers.round().astype("Int64")
+        else:
+            ids[id] = _string_ids(df[id])
+    return df.assign(**ids)
+
+
+def _schema(df: pandas.DataFrame) -> pyarrow.Schema:
+    """
+    Arrow schema of `df` (see `typed()`) storing integer IDs as `int64` and dictionary-encoding string IDs.
+    """
+    schema = pyarrow.Schema.from_pandas(df, preserve_index=False)
+    for id in df.columns.intersection(list(DTYPE_LIST)):
+        if DTYPE_LIST[id] == "Int64":
+            id_type = pyarrow.int64()
+        else:
+            id_type = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+        schema = schema.set(schema.get_field_index(id), pyarrow.field(id, id_type))
+    return schema
+
+
+def _dump(df: pandas.DataFrame, cache_path: str, fname: str):
+    df = typed(df).reset_index(drop=True)
+    cache.dump(df, cache_path, fname, _schema(df))
+
+
+def _load(
+    cache_path: str, fname: str, legacy: str, **read_csv
+) -> pandas.DataFrame | None:
+    """
+    Load an ID table stored by `_dump()`. A CSV file written by earlier versions under `legacy` is converted
+    (and removed) on first use. Returns `None` if neither exists.
+    """
+    legacy_path = cache_path + legacy
+    if os.path.exists(legacy_path):
+        _dump(pandas.read_csv(legacy_path, **read_csv), cache_path, fname)
+        os.remove(legacy_path)
+    if not cache.exists(cache_path, fname):
+        return None
+    return typed(cache.load(cache_path, fname))
+
+
+def _tqdm(*args, **kwargs):
+    """
+    `tqdm.tqdm()`, imported on first use.
+    """
+    import tqdm
+
+    return tqdm.tqdm(*args, **kwargs)
+
+
 def current_season() -> int:
     today = datetime.datetime.today()
     if today.month <= 3:
@@ -76,10 +142,20 @@ def current_season() -> int:
         return today.year
 
 
+def _fetch() -> pandas.DataFrame:
+    """
+    Fetch the player ID map from the web source.
+    """
+    import nfl_data_py
+
+    return typed(nfl_data_py.import_ids())
+
+
 def get_mapping(cache_path: str = None, refresh: bool = False) -> pandas.DataFrame:
     """
     Load the player ID map. If a cache path is provided `get_mapping` will check to see if a mapping file already exists,
-    if it does not it will store the mapping in the cache.
+    if it does not it will store the mapping in the cache. The map is stored like every other dataset (see `cache.set_format()`)
+    with typed ID columns (see `typed()`); a CSV map written by earlier versions is converted on first use.
 
     Parameters
     ----------
@@ -97,22 +173,80 @@ def get_mapping(cache_path: str = None, refresh: bool = False) -> pandas.DataFra
         Player ID map.
     """
     if cache_path:
-        path = cache_path + cache.fname_players() + "-idraw.csv"
-        if os.path.exists(path) and refresh == False:
-            return pandas.read_csv(path)
-        else:
-            df = nfl_data_py.import_ids()
-            df.to_csv(path)
-            return df
+        legacy_path = cache_path + cache.fname_ids_legacy()
+        if refresh and os.path.exists(legacy_path):
+            os.remove(legacy_path)
+        df = None
+        if refresh == False:
+            df = _load(
+                cache_path, cache.fname_ids(), cache.fname_ids_legacy(), index_col=0
+            )
+        if df is None:
+            df = _fetch()
+            _dump(df, cache_path, cache.fname_ids())
+        return df
     else:
-        return nfl_data_py.import_ids()
+        return _fetch()
+
+
+def index_ids(id_map: pandas.DataFrame) -> dict[str, dict]:
+    """
+    Build a hash index of `id_map`: for each ID type (column), a dictionary from ID to the position
+    of the first row holding it. Missing IDs are not indexed.
+
+    Parameters
+    ----------
+
+    id_map : pandas.DataFrame
+        Table of IDs where each row is a player and column a type of ID. `None`/`NaN` may exist.
+
+    Returns
+    -------
 
+    out : dict[str, dict]
+        Key = ID type; Value = dictionary from ID to row position
+    """
+    index = {}
+    for id in id_map.columns:
+        notna = id_map[id].notna().to_numpy()
+        values = id_map[id].to_numpy()[notna]
+        positions = numpy.flatnonzero(notna)
+        index[id] = dict(zip(values[::-1].tolist(), positions[::-1].tolist()))
+    return index
+
+
+def _matches(row: dict, id_dict: dict[str, str]) -> bool:
+    """
+    Whether every ID of `id_dict` that is a column of the map is equal in `row`.
+    """
+    for id in id_dict:
+        if id in row and (pandas.isna(row[id]) or row[id] != id_dict[id]):
+            return False
+    return True
 
-def locate_map(id_map: pandas.DataFrame, id_dict: dict[str, str]) -> pandas.Series:
+
+def _locate(
+    index: dict[str, dict], rows: list[dict], id_dict: dict[str, str]
+) -> int | None:
+    """
+    Position of the row in `rows` (the records of a map indexed by `index_ids()`) matching `id_dict`, see `locate_map()`.
+    """
+    for id in id_dict:
+        if id in index:
+            position = index[id].get(id_dict[id])
+            if position is not None and _matches(rows[position], id_dict):
+                return position
+    return None
+
+
+def locate_map(
+    id_map: pandas.DataFrame, id_dict: dict[str, str], index: dict[str, dict] = None
+) -> pandas.Series:
     """
     Locates the row in `id_map` matching the player IDs given in `id_dict`. All IDs present
     in both `id_map` and `id_dict` must be equal to be considered "matching". If no match is found,
-    and empty `pandas.Series(dtype="string")` is returned.
+    and empty `pandas.Series(dtype="string")` is returned. For each ID type only the first row
+    holding the ID is considered.
 
     Parameters
     ----------
@@ -123,26 +257,59 @@ def locate_map(id_map: pandas.DataFrame, id_dict: dict[str, str]) -> pandas.Seri
     id_dict : dict[str, str]
         Dictionary of IDs for a single player to match with the `id_map`. Key = ID type; Value = ID
 
+    index : dict[str, dict] = None
+        Index of `id_map` from `index_ids()`. Pass it when locating many players in the same map so it is
+        only built once.
+
     Returns
     -------
 
     out : pandas.Series
         Matching player series from the `id_map` or an empty series if no match was found.
     """
+    if index is None:
+        index = index_ids(id_map[id_map.columns.intersection(list(id_dict))])
     for id in id_dict:
-        if id in id_map.columns:
-            mask = id_map[id] == id_dict[id]
-            df = id_map[mask]
-            if len(df) > 0:
-                series = df.iloc[0]
-                series_compare = pandas.Series(id_dict)
-                common = series.index.intersection(series_compare.index)
-                same = all(series[common] == series_compare[common])
-                if same:
+        if id in index:
+            position = index[id].get(id_dict[id])
+            if position is not None:
+                series = id_map.iloc[position]
+                if _matches(series.to_dict(), id_dict):
                     return series
     return pandas.Series(dtype="string")
 
 
+def _components(id_map: pandas.DataFrame) -> numpy.ndarray:
+    """
+    Connected components of the rows of `id_map`, where two rows are connected if they share a non-missing ID of
+    the same type. Each row is labelled with the position of the first row of its component.
+
+    Computed with a vectorized union-find: every row points at a row of its component (initially itself), each
+    ID is hooked onto the smallest pointer among the rows holding it, and pointers are shortcut until nothing changes.
+    """
+    labels = numpy.arange(len(id_map))
+    edges = []
+    for id in id_map.columns:
+        codes, uniques = pandas.factorize(id_map[id])
+        rows = numpy.flatnonzero(codes >= 0)
+        edges.append((codes[rows], rows, len(uniques)))
+    changed = len(id_map) > 0
+    while changed:
+        previous = labels.copy()
+        for codes, rows, size in edges:
+            roots = numpy.full(size, len(id_map))
+            numpy.minimum.at(roots, codes, labels[rows])
+            numpy.minimum.at(labels, labels[rows], roots[codes])
+            labels[rows] = numpy.minimum(labels[rows], roots[codes])
+        while True:
+            jumped = labels[labels]
+            if numpy.array_equal(jumped, labels):
+                break
+            labels = jumped
+        changed = not numpy.array_equal(previous, labels)
+    return labels
+
+
 class IDKeeper:
     """
     Class for keeping track of player IDs. An instance of `IDKeeper` is associated with a single cache directory which
@@ -152,9 +319,6 @@ class IDKeeper:
     def __init__(self):
         pass
 
-    def _path(self, cache_path: str) -> str:
-        return cache_path + cache.fname_players() + "-idkeeper.csv"
-
     def load(self, cache_path: str):
         """
         Load the `IDKeeper` from the given cache directory or create one if it does not exist.
@@ -166,17 +330,23 @@ class IDKeeper:
             Cache directory location
         """
         self.cache_path = cache_path
-        path = self._path(cache_path)
-        self.df = pandas.DataFrame({id_header: [] for id_header in DTYPE_LIST})
-        if os.path.exists(path):
-            self.df = pandas.concat([self.df, pandas.read_csv(path, index_col=0)])
+        df = _load(
+            cache_path,
+            cache.fname_idkeeper(),
+            cache.fname_idkeeper_legacy(),
+            index_col=0,
+            dtype=str,
+        )
+        if df is None:
+            df = pandas.DataFrame({id_header: [] for id_header in DTYPE_LIST})
+        self.df = typed(df.reindex(columns=list(DTYPE_LIST)).reset_index(drop=True))
+        self.index = index_ids(self.df)
 
     def dump(self):
         """
         Save the `IDKeeper` to associated cach direcotry.
         """
-        path = self._path(self.cache_path)
-        self.df.to_csv(path, index=True)
+        _dump(self.df, self.cache_path, cache.fname_idkeeper())
 
     def exists(self, id_dict: dict[str, str]) -> bool:
         """
@@ -196,7 +366,7 @@ class IDKeeper:
             Whether the player exists in the `IDKeeper`
         """
         for id in id_dict:
-            if id_dict[id] in self.df[id].values:
+            if id_dict[id] in self.index[id]:
                 return True
         return False
 
@@ -211,27 +381,69 @@ class IDKeeper:
         id_dict : dict[str, str]
             IDs to append to the `IDKeeper`. Key = ID type; Value = ID
         """
-        if not self.exists(id_dict):
-            row = {id: None for id in DTYPE_LIST}
-            for id in id_dict:
-                row[id] = id_dict[id]
-            self.df.loc[len(self)] = row
+        self.append_many(pandas.DataFrame([id_dict]))
+
+    def append_many(self, df: pandas.DataFrame):
+        """
+        Append the players given by the rows of `df` (one column per ID type) to the keeper, with the same result as
+        calling `IDKeeper.append()` for each row in order: a row is skipped if one of its IDs already exists in the
+        `IDKeeper` or in an earlier appended row.
+
+        Rows known to the keeper are dropped with one lookup per ID type and the rest are appended in a single
+        concatenation. Only rows sharing an ID with another row of `df` are checked one at a time.
+
+        Parameters
+        ----------
+
+        df : pandas.DataFrame
+            IDs to append to the `IDKeeper`. Columns = ID types
+        """
+        df = typed(df).reset_index(drop=True)
+        known = numpy.zeros(len(df), dtype=bool)
+        for id in df.columns:
+            known |= df[id].isin(list(self.index[id])).to_numpy()
+        df = df[~known].reset_index(drop=True)
+        shared = numpy.zeros(len(df), dtype=bool)
+        for id in df.columns:
+            shared |= (df[id].notna() & df[id].duplicated(keep=False)).to_numpy()
+        keep = ~shared
+        seen = {id: set() for id in df.columns}
+        for position in numpy.flatnonzero(shared):
+            row = {
+                id: value
+                for id, value in df.iloc[position].items()
+                if not pandas.isna(value)
+            }
+            if not any(row[id] in seen[id] for id in row):
+                keep[position] = True
+                for id in row:
+                    seen[id].add(row[id])
+        new = typed(df[keep].reindex(columns=self.df.columns))
+        offset = len(self)
+        self.df = pandas.concat([self.df, new], ignore_index=True)
+        new_index = index_ids(new)
+        for id in new_index:
+            for value, position in new_index[id].items():
+                self.index[id].setdefault(value, offset + position)
 
     def _update_mapping(self, id_map: pandas.DataFrame, part_i: int, part_total: int):
         """
         Updates a single mapping given by `id_map` as opposed to all the mappings which is performed by `IDKeeper.update_mapping()`
         """
-        for index in tqdm.tqdm(
-            iterable=self.df.index,
+        map_index = index_ids(id_map)
+        map_rows = id_map.to_dict("records")
+        for index, row in _tqdm(
+            iterable=zip(self.df.index, self.df.to_dict("records")),
             desc="Updating map part: " + str(part_i) + " of " + str(part_total),
             total=len(self.df),
         ):
-            id_dict = self.df.iloc[index].dropna().to_dict()
-            series = locate_map(id_map, id_dict)
-            if not series.empty:
-                series_dict = series.to_dict()
+            id_dict = {id: row[id] for id in row if not pandas.isna(row[id])}
+            position = _locate(map_index, map_rows, id_dict)
+            if position is not None:
+                series_dict = map_rows[position]
                 for id in series_dict:
                     self.df.at[index, id] = series_dict[id]
+        self.index = index_ids(self.df)
 
     def update_mapping(self, update_map: bool = False):
         """
@@ -275,19 +487,15 @@ class IDKeeper:
             List of seasons to get draft data for
         """
         drafts_df = drafts.get(seasons, self.cache_path)
-        for _, draft_series in tqdm.tqdm(
-            iterable=drafts_df.iterrows(),
-            desc="Updating the IDKeeper with drafted players data",
-            total=len(drafts_df),
-        ):
-            ids = draft_series[
+        self.append_many(
+            drafts_df[
                 [
                     drafts.cols.CfbPlayerId.header,
                     drafts.cols.PfrPlayerId.header,
                     "extra_ID",
                 ]
-            ].to_dict()
-            self.append(ids)
+            ]
+        )
         self.update_mapping()
         self.dump()
 
@@ -298,20 +506,16 @@ class IDKeeper:
         otherwise it will use data stored in the cache if it exists.
         """
         players_df = players.get(self.cache_path, refresh_players)
-        for _, player_series in tqdm.tqdm(
-            iterable=players_df.iterrows(),
-            desc="Updating the IDKeeper with players data",
-            total=len(players_df),
-        ):
-            ids = player_series[
+        self.append_many(
+            players_df[
                 [
                     players.cols.EsbId.header,
                     players.cols.GsisId.header,
                     players.cols.SmartId.header,
                     "extra_ID",
                 ]
-            ].to_dict()
-            self.append(ids)
+            ]
+        )
         self.update_mapping()
         self.dump()
 
@@ -336,14 +540,7 @@ class IDKeeper:
             "extra_ID",
         ]
         roster_df = rosters.get(seasons, self.cache_path, update_last_season)
-        roster_df = roster_df[COLS].drop_duplicates()
-        for _, roster_series in tqdm.tqdm(
-            iterable=roster_df.iterrows(),
-            desc="Updating the IDKeeper with rosters data",
-            total=len(roster_df),
-        ):
-            ids = roster_series.to_dict()
-            self.append(ids)
+        self.append_many(roster_df[COLS].drop_duplicates())
         self.update_mapping()
         self.dump()
 
@@ -363,7 +560,8 @@ class IDKeeper:
 
 class IDMap:
     def __init__(self):
-        pass
+        self._translations = {}
+        self._translations_df = None
 
     def load(self, cache_path: str):
         """
@@ -376,19 +574,19 @@ class IDMap:
             Cache directory location
         """
         self.cache_path = cache_path
-        self.path = cache_path + cache.fname_players() + "-idmap.csv"
-        self.df = pandas.DataFrame({id_header: [] for id_header in DTYPE_LIST})
-        self.df = self.df.astype(dtype=DTYPE_LIST)
-        if os.path.exists(self.path):
-            self.df = pandas.concat(
-                [self.df, pandas.read_csv(self.path, dtype=DTYPE_LIST)]
-            )
+        df = _load(
+            cache_path, cache.fname_idmap(), cache.fname_idmap_legacy(), dtype=str
+        )
+        if df is None:
+            df = pandas.DataFrame({id_header: [] for id_header in DTYPE_LIST})
+        self.df = typed(df.reindex(columns=list(DTYPE_LIST)))
+        self.conflicts = self.df.assign(component=pandas.Series(dtype="int64"))
 
     def dump(self):
         """
         Save the `IDMap` to the associated cach direcotry.
         """
-        self.df.to_csv(self.path, index=False)
+        _dump(self.df, self.cache_path, cache.fname_idmap())
 
     def add_bi_map(self, update: bool = False):
         """
@@ -402,7 +600,7 @@ class IDMap:
         """
         bi_map = get_mapping(self.cache_path, update)
         bi_map_cols = bi_map.columns.intersection(DTYPE_LIST).to_list()
-        self.df = pandas.concat([self.df, bi_map[bi_map_cols]])
+        self.df = pandas.concat([self.df, bi_map[bi_map_cols]], ignore_index=True)
 
     def add_drafts(self, seasons: list[int]):
         """
@@ -420,7 +618,9 @@ class IDMap:
             "extra_ID",
         ]
         drafts_df = drafts.get(seasons, self.cache_path)
-        self.df = pandas.concat([self.df, drafts_df[draft_cols]])
+        self.df = pandas.concat(
+            [self.df, typed(drafts_df[draft_cols])], ignore_index=True
+        )
 
     def add_players(self, update: bool = False):
         """
@@ -439,7 +639,9 @@ class IDMap:
             "extra_ID",
         ]
         players_df = players.get(self.cache_path, update)
-        self.df = pandas.concat([self.df, players_df[player_cols]])
+        self.df = pandas.concat(
+            [self.df, typed(players_df[player_cols])], ignore_index=True
+        )
 
     def add_rosters(self, seasons: list[int], update: bool = False):
         """
@@ -469,75 +671,100 @@ class IDMap:
             "extra_ID",
         ]
         roster_df = rosters.get(seasons, self.cache_path, update)
-        self.df = pandas.concat([self.df, roster_df[roster_cols].drop_duplicates()])
+        roster_df = typed(roster_df[roster_cols].drop_duplicates())
+        self.df = pandas.concat([self.df, roster_df], ignore_index=True)
 
-    def _unify_column_indexes_match(self, index1: int, index2: int) -> bool:
+    def drop_duplicates(self):
         """
-        Check whether two indexes match in there non-missing IDs.
+        Drop duplicates and reset the index.
         """
-        matches = self.df.iloc[[index1, index2]]
-        matches = matches.dropna(axis=1)
-        matches = matches.drop_duplicates()
-        if len(matches) == 1:
-            return True
-        else:
-            return False
+        self.df = self.df.drop_duplicates()
+        self.df = self.df.dropna(how="all")
+        self.df = self.df.reset_index(drop=True)
 
-    def _unify_column_first_dupes(self, column: str) -> pandas.Series:
-        """
-        Get the index of an IDs first occurance if it has duplicates.
+    def maptize(self):
         """
-        series = self.df[column].dropna()
-        all_dupes = series.duplicated(keep=False)
-        first_dupe = series.duplicated(keep="first")
-        return all_dupes ^ first_dupe
+        Aggregate all the matcing IDs together.
 
-    def _unify_column_combine_rows(self, index: int, match_index: int):
+        Rows sharing an ID are connected, and each connected group of rows is merged into a single row. A group holding two
+        different IDs of the same type is not merged: its rows are kept as they are and listed in `IDMap.conflicts`
+        (with the group in a `"component"` column) to be checked manually.
         """
-        Aggregate two rows IDs by their indexes.
-        """
-        new_series = self.df.iloc[index].combine_first(self.df.iloc[match_index])
-        self.df.iloc[index] = new_series
-        self.df.iloc[match_index] = None
+        self.drop_duplicates()
+        self.df = self.df.replace(0, None)
+        labels = _components(self.df)
+        conflicting = (self.df.groupby(labels).nunique() > 1).any(axis=1)
+        conflict_rows = conflicting.loc[labels].to_numpy()
+        merged = self.df[~conflict_rows].groupby(labels[~conflict_rows], sort=False)
+        merged = merged.first()
+        kept = self.df[conflict_rows]
+        self.conflicts = kept.assign(component=labels[conflict_rows])
+        order = numpy.concatenate(
+            [merged.index.to_numpy(), numpy.flatnonzero(conflict_rows)]
+        )
+        self.df = pandas.concat([merged, kept], ignore_index=True)
+        self.df = self.df.iloc[numpy.argsort(order, kind="stable")]
+        self.drop_duplicates()
+
+    def _translation(
+        self, from_type: str, to_type: str
+    ) -> tuple[pandas.Index, pandas.Series]:
+        """
+        Hash index of the `from_type` IDs and the aligned `to_type` IDs, built once per pair of ID types and reused
+        until `IDMap.df` changes. If an ID is held by several rows, the first one is used.
+        """
+        if self._translations_df is not self.df:
+            self._translations = {}
+            self._translations_df = self.df
+        if (from_type, to_type) not in self._translations:
+            pairs = self.df[[from_type, to_type]].dropna(subset=[from_type])
+            pairs = pairs.drop_duplicates(subset=[from_type])
+            self._translations[(from_type, to_type)] = (
+                pandas.Index(pairs[from_type]),
+                pairs[to_type].reset_index(drop=True),
+            )
+        return self._translations[(from_type, to_type)]
 
-    def _unify_column(self, column: str):
+    def translate(
+        self,
+        values: pandas.Series | numpy.ndarray | list,
+        from_type: str,
+        to_type: str,
+    ) -> pandas.Series | numpy.ndarray:
         """
-        For the given column, attempt to find duplicate IDs and match the together.
+        Translate a whole column of player IDs from one ID type to another, i.e. the GSIS IDs of the `passer_player_id`
+        column of the play-by-play data to Sleeper IDs. IDs not found in the map (and missing IDs) translate to missing.
 
         Parameters
         ----------
 
-        Columns : str
-            The given column to work on
-        """
-        dupes = self._unify_column_first_dupes(column)
-        for index, is_dup in dupes.items():
-            if is_dup:
-                match_indexes = self.df.index[
-                    self.df[column] == self.df[column].iloc[index]
-                ].to_list()
-                for match_index in match_indexes:
-                    if match_index != index:
-                        if self._unify_column_indexes_match(index, match_index):
-                            self._unify_column_combine_rows(index, match_index)
+        values : pandas.Series | numpy.ndarray | list
+            IDs of type `from_type`
 
-    def drop_duplicates(self):
-        """
-        Drop duplicates and reset the index.
-        """
-        self.df = self.df.drop_duplicates()
-        self.df = self.df.dropna(how="all")
-        self.df = self.df.reset_index(drop=True)
+        from_type : str
+            ID type of `values`, i.e. `ids.GSIS`
 
-    def maptize(self):
-        """
-        Aggregate all the matcing IDs together.
+        to_type : str
+            ID type to translate to, i.e. `ids.SLEEPER`
+
+        Returns
+        -------
+
+        out : pandas.Series | numpy.ndarray
+            Translated IDs aligned with `values`: a `pandas.Series` with the same index if `values` is a series,
+            otherwise a `numpy.ndarray`.
+
+        Examples
+        --------
+
+            >>> id_map.translate(df["passer_player_id"], ids.GSIS, ids.SLEEPER)
         """
-        self.drop_duplicates()
-        self.df = self.df.replace(0, None)
-        for column in tqdm.tqdm(self.df.columns, total=len(self.df.columns)):
-            self._unify_column(column)
-            self.drop_duplicates()
+        index, targets = self._translation(from_type, to_type)
+        positions = index.get_indexer(pandas.Index(values))
+        translated = targets.reindex(positions)
+        if isinstance(values, pandas.Series):
+            return translated.set_axis(values.index)
+        return translated.to_numpy()
 
     def manual_id_check(self):
         """
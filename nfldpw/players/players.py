@@ -1,76 +1,42 @@
-import nfl_data_py
 from .. import cache
-from . import cols
 import pandas
-import os
-import numpy
-from ..drafts import EXTRA_DRAFT_ID
-
-
-def _rounder(x: numpy.float32) -> str:
-    """
-    Simple rounder applied to a data series in `_create_extra_ID()`. Converts `WXY.Z` to `"WXY"`. Returns `""` for `NaN`.
-    """
-    if numpy.isnan(x):
-        return ""
-    else:
-        return str(round(x))
+import pyarrow
+from .. import extra_id
+from ..extra_id import EXTRA_DRAFT_ID
 
 
 def _create_extra_ID(df: pandas.DataFrame) -> pandas.DataFrame:
     """
-    Create the extra draft ID.
-
-    -----
-    Style
-    -----
-
-    id = [Draft Team][Draft Number Ovr (i.e. `round * pick`)][Full Name]
-
-    Notes
-    -----
-
-    * In [Full Name], "." is replaced by "_" and " " is replaced by "-".
-
-    * Depending on when a player was drafted, their Draft ID may show up with outdated team abbreviations (e.i. "STL", "SD", etc.).
-    However, this should **_not_** be cause for concern as most sources where Draft IDs are generated from are consistent with the outdated
-    team abbreviations.
-
-    -------
-    Example
-    -------
-
-    E.J. Henderson: Drafted 40th overall by the Minnesoda Vikings
-
-    `MIN40E_J_-Henderson`
-
-    ------------
-    Known Issues
-    ------------
+    Add the extra draft ID (see `nfldpw.extra_id`). Players without a draft club have no ID.
+    """
+    from . import cols
 
-    * Some sources might stylize E.J. Henderson's name as "Eric Henderson".
-    In this case the auto-generated draft ID would be created as `MIN40Eric-Henderson` and will not
-    match when compared against `MIN40E_J_-Henderson`.
+    ids = extra_id.extra_id(
+        df[cols.DraftClub.header],
+        df[cols.DraftNumber.header],
+        [df[cols.FirstName.header], df[cols.LastName.header]],
+        missing_number="",
+    )
+    return extra_id.assign(df, ids)
 
-    * Additionally, as it might be apparent, Draft ID is not 100% unique, but rather an auto-generated ID used to assist
-    in matching players between different data sources. Inappropriate matches may occur, although they should be very rare.
 
+def _fetch() -> pandas.DataFrame:
     """
-    df[EXTRA_DRAFT_ID] = (
-        df[cols.DraftClub.header]
-        + df[cols.DraftNumber.header].apply(_rounder)
-        + df[cols.FirstName.header]
-        .str.replace(" ", "-", regex=False)
-        .str.replace(".", "_", regex=False)
-        + "-"
-        + df[cols.LastName.header]
-        .str.replace(" ", "-", regex=False)
-        .str.replace(".", "_", regex=False)
-    )
-    return df
+    Fetch and compact the players data, adding the extra draft ID so that it is stored in the cache.
+    """
+    import nfl_data_py
+    from . import cols
 
+    return _create_extra_ID(cache.compact(nfl_data_py.import_players(), cols))
 
-def get(cache_path: str = None, refresh_cache: bool = False) -> pandas.DataFrame:
+
+def get(
+    cache_path: str = None,
+    refresh_cache: bool = False,
+    columns: list = None,
+    arrow_strings: bool = None,
+    as_arrow: bool = False,
+) -> pandas.DataFrame | pyarrow.Table:
     """
     Get descriptive player data. If a cache path is provided, data will be read
     from the cache or stored in the cache if calling for the first time. Otherwise,
@@ -86,27 +52,52 @@ def get(cache_path: str = None, refresh_cache: bool = False) -> pandas.DataFrame
     refresh_cache : bool = False
         Whether or not the cache should be refreshed with the most up-to-date player data.
 
+    columns : list = None
+        Columns to load, given as header strings or `cols` classes. All columns are loaded if `None`.
+
+    arrow_strings : bool = None
+        Whether string columns are returned as Arrow-backed `string[pyarrow]` instead of Python objects.
+        Defaults to `cache.set_arrow_strings()` (`True`).
+
+    as_arrow : bool = False
+        Whether to return the `pyarrow.Table` instead of converting it to pandas.
+
     Returns
     -------
 
-        out : pandas.DataFrame
+        out : pandas.DataFrame | pyarrow.Table
 
     Examples
     --------
 
         >>> players.get("path_to_cache/")
     """
-    df = pandas.DataFrame()
+    columns = cache.headers(columns)
+    arrow_strings = cache.use_arrow_strings(arrow_strings)
     if cache_path:
-        if (
-            os.path.exists(cache_path + cache.fname_players() + ".parq")
-            and refresh_cache == False
-        ):
-            df = cache.load(cache_path, cache.fname_players())
+        if cache.exists(cache_path, cache.fname_players()) and refresh_cache == False:
+            cache.upgrade_column(
+                cache_path, cache.fname_players(), EXTRA_DRAFT_ID, _create_extra_ID
+            )
+            table = cache.load_table(cache_path, cache.fname_players(), columns)
         else:
-            df = nfl_data_py.import_players()
+            df = _fetch()
             cache.dump(df, cache_path, cache.fname_players())
+            table = cache.to_table(df, columns=columns)
     else:
-        df = nfl_data_py.import_players()
-    df = _create_extra_ID(df)
-    return df
+        table = cache.to_table(_fetch(), columns=columns)
+    return cache.output(table, as_arrow, arrow_strings)
+
+
+async def aget(*args, **kwargs) -> pandas.DataFrame | pyarrow.Table:
+    """
+    Awaitable `get()` taking the same parameters. Cache reads and web fetches run in a worker
+    thread so the event loop is not blocked, and several calls (of any dataset) may be awaited
+    concurrently, bounded by `cache.set_async_limit()`.
+
+    Examples
+    --------
+
+        >>> dfs = await asyncio.gather(players.aget("path_to_cache/"), rosters.aget([2023], "path_to_cache/"))
+    """
+    return await cache.run_async(get, *args, **kwargs)
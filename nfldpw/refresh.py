@@ -0,0 +1,212 @@
+"""
+=========================
+Background refresh daemon
+=========================
+
+Keeps the incomplete season of a cache directory up to date. The season's schedule tells when
+games end, and only the data affected by finished games is reloaded:
+
+* schedules, once a game that kicked off more than `GAME_LENGTH` ago has no result in the cache
+
+* play-by-play, while a week with finished games is not cached or is incomplete in the cache metadata
+and was last fetched less than `PBP_SETTLE` after its last game ended, so late corrections of the
+play-by-play data are picked up (only the changed weeks are rewritten)
+
+* rosters, once a week with finished games is missing from the cached rosters
+
+```
+python -m nfldpw.refresh path_to_cache/
+python -m nfldpw.refresh path_to_cache/ --season 2024 --interval 600
+python -m nfldpw.refresh path_to_cache/ --once
+```
+
+Cache files are replaced atomically, so other processes may read the cache while it runs.
+"""
+
+import argparse
+import datetime
+import time
+import pandas
+from . import cache
+from . import pbp
+from . import rosters
+from . import schedules
+from .players.ids import current_season
+
+
+GAME_LENGTH = datetime.timedelta(hours=4)
+
+PBP_SETTLE = datetime.timedelta(hours=24)
+
+TIMEZONE = "America/New_York"
+
+INTERVAL = 900
+
+DATASETS = ["pbp", "rosters", "schedules"]
+
+
+def _kickoffs(df: pandas.DataFrame) -> pandas.Series:
+    """
+    Kickoff time (UTC) of each game. `gametime` is given in Eastern time.
+    """
+    kickoffs = pandas.to_datetime(
+        df[schedules.cols.Gameday.header].astype(str)
+        + " "
+        + df[schedules.cols.Gametime.header].astype(str),
+        errors="coerce",
+    )
+    return kickoffs.dt.tz_localize(TIMEZONE, ambiguous="NaT").dt.tz_convert("UTC")
+
+
+def _due(df: pandas.DataFrame, now: pandas.Timestamp) -> pandas.Series:
+    """
+    Games that should have ended by `now` but have no result yet.
+    """
+    ended = _kickoffs(df) + GAME_LENGTH <= now
+    return ended & df[schedules.cols.Result.header].isna()
+
+
+def _pbp_due(cache_path: str, season: int, finished: pandas.DataFrame) -> bool:
+    """
+    Whether a week with `finished` games is not cached, or is incomplete (see `MdataStore`) and was
+    fetched less than `PBP_SETTLE` after its last game ended.
+    """
+    with cache.MdataStore(cache_path) as mdata:
+        weeks = mdata.partitions("pbp", cache.partition(season) + "/")
+    ends = _kickoffs(finished) + GAME_LENGTH
+    week_ends = ends.groupby(finished[schedules.cols.Week.header]).max()
+    for week, end in week_ends.items():
+        week_mdata = weeks.get(cache.partition(season, int(week)))
+        if week_mdata is None:
+            return True
+        if week_mdata["complete"] or pandas.isna(end):
+            continue
+        fetched = pandas.Timestamp(week_mdata["fetched"] or 0, unit="s", tz="UTC")
+        if fetched < end + PBP_SETTLE:
+            return True
+    return False
+
+
+def refresh_season(
+    cache_path: str, season: int, datasets: list[str] = None
+) -> dict[str, bool]:
+    """
+    Refresh the partitions of `season` affected by finished games.
+
+    Parameters
+    ----------
+
+    cache_path : str
+        Path to a directory where cache files are stored
+
+    season : int
+        The incomplete season to refresh
+
+    datasets : list[str] = None
+        Datasets to refresh, any of `"pbp"`, `"rosters"` and `"schedules"` (default all)
+
+    Returns
+    -------
+
+        out : dict[str, bool]
+            Whether each dataset was reloaded from the web source
+    """
+    datasets = datasets or DATASETS
+    reloaded = {dataset: False for dataset in datasets}
+    sched_cols = [
+        schedules.cols.GameId,
+        schedules.cols.Week,
+        schedules.cols.Gameday,
+        schedules.cols.Gametime,
+        schedules.cols.Result,
+    ]
+    sched = schedules.get([season], cache_path, columns=sched_cols)
+    now = pandas.Timestamp.now(tz="UTC")
+    if "schedules" in datasets and _due(sched, now).any():
+        sched = schedules.get([season], cache_path, True, columns=sched_cols)
+        reloaded["schedules"] = True
+    finished = sched[sched[schedules.cols.Result.header].notna()]
+    if len(finished) == 0:
+        return reloaded
+    if "pbp" in datasets:
+        if _pbp_due(cache_path, season, finished):
+            pbp.get([season], cache_path, True, columns=[pbp.cols.GameId])
+            reloaded["pbp"] = True
+    if "rosters" in datasets:
+        cached = rosters.get([season], cache_path, columns=[rosters.cols.Week])
+        missing = set(finished[schedules.cols.Week.header]) - set(
+            cached[rosters.cols.Week.header]
+        )
+        if len(missing) > 0:
+            rosters.get([season], cache_path, True, columns=[rosters.cols.Week])
+            reloaded["rosters"] = True
+    return reloaded
+
+
+def run(
+    cache_path: str,
+    season: int = None,
+    interval: float = INTERVAL,
+    datasets: list[str] = None,
+    once: bool = False,
+):
+    """
+    Call `refresh_season()` every `interval` seconds until interrupted (or once if `once`).
+    Errors from the web source are printed and retried on the next cycle.
+    """
+    while True:
+        refresh_for = season or current_season()
+        try:
+            reloaded = refresh_season(cache_path, refresh_for, datasets)
+            print(
+                datetime.datetime.now().isoformat(timespec="seconds"),
+                "season",
+                refresh_for,
+                "reloaded:",
+                ", ".join(name for name in reloaded if reloaded[name]) or "none",
+                flush=True,
+            )
+        except Exception as e:
+            if once:
+                raise
+            print("Refresh failed:", repr(e), flush=True)
+        if once:
+            return
+        time.sleep(interval)
+
+
+def main(argv: list[str] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m nfldpw.refresh",
+        description="Refresh the incomplete season of an nfldpw cache as games finish.",
+    )
+    parser.add_argument("cache_path", help="path to the cache directory")
+    parser.add_argument(
+        "--season", type=int, default=None, help="season (default current)"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=INTERVAL,
+        help="seconds between refreshes (default " + str(INTERVAL) + ")",
+    )
+    parser.add_argument(
+        "--datasets",
+        nargs="+",
+        choices=DATASETS,
+        default=DATASETS,
+        help="datasets to refresh (default all)",
+    )
+    parser.add_argument("--once", action="store_true", help="refresh once and exit")
+    args = parser.parse_args(argv)
+    cache_path = args.cache_path
+    if not cache_path.endswith("/"):
+        cache_path += "/"
+    try:
+        run(cache_path, args.season, args.interval, args.datasets, args.once)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 Rosters data
 =================
 
-Use `get()` for general NFL roster data.
+Use `get()` (or the awaitable `aget()`) for general NFL roster data.
 
 Available submodules
 --------------------
@@ -16,5 +16,19 @@ cols:
 
 """
 
+import importlib
 from .rosters import get
-from . import cols
+from .rosters import aget
+from .rosters import iter_seasons
+
+
+LAZY_SUBMODULES = ["cols"]
+
+
+def __getattr__(name: str):
+    """
+    Import the submodules in `LAZY_SUBMODULES` on first access.
+    """
+    if name in LAZY_SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
@@ -1,121 +1,106 @@
-import nfl_data_py
+from typing import Iterator
 from .. import cache
 import pandas
-from .. import sbowls
-from . import cols
-from ..drafts import EXTRA_DRAFT_ID
-import datetime
+import pyarrow
+from .. import completeness
+from .. import extra_id
+from ..extra_id import EXTRA_DRAFT_ID
+import functools
 
 
 DAYS_GREATER = 14
 
 
-def _season_complete(season: int, cache_path: str) -> bool:
-    sb_dates = sbowls.load_superbowl_dates(cache_path)
-    for date in sb_dates:
-        if date.year - 1 == season:
-            if datetime.datetime.today() > date + datetime.timedelta(DAYS_GREATER):
-                return True
-    return False
-
-
-NONE_CHAR = "$NONE$"
-
-
-def _check_none(x: str) -> str | None:
-    if NONE_CHAR in x:
-        return None
-    else:
-        return x
-
-
-def _drft_num(x: str | int) -> str:
-    if isinstance(x, str):
-        return str(round(float(x)))
-    else:
-        if x == 0:
-            return NONE_CHAR
-        else:
-            return str(round(x))
-
-
 def _create_extra_ID(df: pandas.DataFrame) -> pandas.DataFrame:
     """
-    Create the extra draft ID.
-
-    -----
-    Style
-    -----
+    Add the extra draft ID (see `nfldpw.extra_id`). Undrafted players (no draft club, or a draft
+    number that is missing or `0`) have no ID.
+    """
+    from . import cols
 
-    id = [Draft Team][Draft Number Ovr (i.e. `round * pick`)][Full Name]
+    ids = extra_id.extra_id(
+        df[cols.DraftClub.header],
+        df[cols.DraftNumber.header],
+        [df[cols.FirstName.header], df[cols.LastName.header]],
+        zero_is_missing=True,
+    )
+    return extra_id.assign(df, ids)
 
-    Notes
-    -----
 
-    * In [Full Name], "." is replaced by "_" and " " is replaced by "-".
+RENAME_MAP = {
+    "player_id": "gsis_id",
+}
 
-    * Depending on when a player was drafted, their Draft ID may show up with outdated team abbreviations (e.i. "STL", "SD", etc.).
-    However, this should **_not_** be cause for concern as most sources where Draft IDs are generated from are consistent with the outdated
-    team abbreviations.
 
-    -------
-    Example
-    -------
+EXTRA_ID_COLS = ["draft_club", "draft_number", "first_name", "last_name"]
 
-    E.J. Henderson: Drafted 40th overall by the Minnesoda Vikings
 
-    `MIN40E_J_-Henderson`
+def _roster_cols_rename(table: pyarrow.Table) -> pyarrow.Table:
+    """
+    Rename roster columns for consistency.
 
-    ------------
-    Known Issues
-    ------------
+    Requiring Rename
+    ----------------
 
-    * Some sources might stylize E.J. Henderson's name as "Eric Henderson".
-    In this case the auto-generated draft ID would be created as `MIN40Eric-Henderson` and will not
-    match when compared against `MIN40E_J_-Henderson`.
+    `"player_id" -> "gsis_id"`
+    """
+    return table.rename_columns(
+        [RENAME_MAP.get(name, name) for name in table.column_names]
+    )
 
-    * Additionally, as it might be apparent, Draft ID is not 100% unique, but rather an auto-generated ID used to assist
-    in matching players between different data sources. Inappropriate matches may occur, although they should be very rare.
 
+def _source_columns(columns: list[str] | None) -> list[str] | None:
     """
-    df[EXTRA_DRAFT_ID] = (
-        df[cols.DraftClub.header].fillna(NONE_CHAR)
-        + df[cols.DraftNumber.header].fillna(0).apply(_drft_num)
-        + df[cols.FirstName.header]
-        .str.replace(" ", "-", regex=False)
-        .str.replace(".", "_", regex=False)
-        + "-"
-        + df[cols.LastName.header]
-        .str.replace(" ", "-", regex=False)
-        .str.replace(".", "_", regex=False)
-    ).apply(_check_none)
-    return df
+    Map the requested columns back to the columns stored in the cache, i.e. undo `_roster_cols_rename()`.
+    """
+    if columns is None:
+        return None
+    inverse = {new: old for old, new in RENAME_MAP.items()}
+    return [inverse.get(col, col) for col in columns]
 
 
-def _roster_cols_rename(df: pandas.DataFrame) -> pandas.DataFrame:
+def _upstream_columns(columns: list[str] | None) -> list[str] | None:
     """
-    Rename roster columns for consistency.
+    Replace the extra draft ID in the cached `columns` with the upstream columns it is created from.
+    """
+    if columns is None or EXTRA_DRAFT_ID not in columns:
+        return columns
+    source = [col for col in columns if col != EXTRA_DRAFT_ID] + EXTRA_ID_COLS
+    return list(dict.fromkeys(source))
 
-    Requiring Rename
-    ----------------
 
-    `"player_id" -> "gsis_id"`
+def _fetch_season(season: int, columns: list[str] = None) -> pandas.DataFrame:
+    """
+    Fetch and compact a season, adding the extra draft ID so that it is stored in the cache.
     """
-    RENAME_MAP = {
-        "player_id": "gsis_id",
-    }
-    df = df.rename(RENAME_MAP, axis="columns")
+    import nfl_data_py
+    from . import cols
+
+    df = nfl_data_py.import_weekly_rosters([season], _upstream_columns(columns))
+    df = cache.compact(df, cols)
+    if all(col in df.columns for col in EXTRA_ID_COLS):
+        df = _create_extra_ID(df)
     return df
 
 
 def get(
-    seasons: list[int], cache_path: str = None, update_last_season: bool = False
-) -> pandas.DataFrame:
+    seasons: list[int],
+    cache_path: str = None,
+    update_last_season: bool = False,
+    columns: list = None,
+    filters: dict | list = None,
+    arrow_strings: bool = None,
+    as_arrow: bool = False,
+    max_staleness: float = 0,
+    background: bool = False,
+    on_refresh=None,
+) -> pandas.DataFrame | pyarrow.Table:
     """
     Get roster data for the list of seasons provided.
     If a cache path is provided, data will be read from the cache
     or stored in the cache if calling for the first time. Otherwise,
     data is loaded from the web source.
+    Seasons are fetched from the web source concurrently (see `cache.set_fetch_workers()`).
 
     Parameters
     ----------
@@ -129,42 +114,157 @@ def get(
     update_last_season : bool = False
         Whether cached seasons that are incomplete should be reloaded (i.e. after a new week has ended).
 
+    columns : list = None
+        Columns to load, given as header strings or `cols` classes. All columns are loaded if `None`.
+
+    filters : dict | list = None
+        Row filters pushed down into the cache read, i.e. `{cols.Week: 5, cols.GameType: cols.GameType.REG}`
+        or `[(cols.Week, ">=", 5)]`. See `cache.predicates()` for the accepted forms.
+
+    arrow_strings : bool = None
+        Whether string columns are returned as Arrow-backed `string[pyarrow]` instead of Python objects.
+        Defaults to `cache.set_arrow_strings()` (`True`).
+
+    as_arrow : bool = False
+        Whether to return the assembled `pyarrow.Table` instead of converting it to pandas.
+
+    max_staleness : float = 0
+        Seconds for which a cached incomplete season is considered fresh. `update_last_season` only reloads
+        seasons fetched longer ago than this.
+
+    background : bool = False
+        Stale-while-revalidate: with `update_last_season`, return the cached copy of incomplete seasons immediately
+        and reload them in a background thread (see `cache.wait_for_refreshes()`).
+
+    on_refresh : Callable[[pandas.DataFrame], None] = None
+        Called with the refreshed result (same seasons, columns and filters) once a background reload has finished.
+
     Returns
     -------
 
-        out : pandas.DataFrame
+        out : pandas.DataFrame | pyarrow.Table
 
     Examples
     --------
 
         >>> rosters.get([2020, 2021, 2022], "path_to_cache/")
     """
-    dfs = []
+    columns = cache.headers(columns)
+    source_columns = _source_columns(columns)
+    filters = cache.predicates(filters, {new: old for old, new in RENAME_MAP.items()})
+    arrow_strings = cache.use_arrow_strings(arrow_strings)
+    tables = []
     if cache_path:
-        mdata = cache.load_rosters_mdata(cache_path)
-        dfs = []
-        for season in seasons:
-            from_cache = True
-            if season in mdata:
-                if not mdata[season] and update_last_season:
-                    from_cache = False
-            else:
-                from_cache = False
-            if from_cache:
-                dfs.append(cache.load(cache_path, cache.fname_rosters(season)))
-            else:
-                df = nfl_data_py.import_weekly_rosters([season])
-                if _season_complete(season, cache_path):
-                    mdata[season] = True
+        with cache.MdataStore(cache_path) as mdata:
+            missing, stale = cache.classify(
+                mdata, "rosters", seasons, update_last_season, max_staleness, background
+            )
+            fetched = cache.fetch(_fetch_season, missing)
+            complete = completeness.seasons_complete(
+                list(fetched), cache_path, DAYS_GREATER
+            )
+            for season in seasons:
+                if season in fetched:
+                    df = fetched[season]
+                    fname = cache.fname_rosters(season)
+                    cache.dump(df, cache_path, fname)
+                    mdata.set(
+                        "rosters",
+                        cache.partition(season),
+                        complete[season],
+                        df,
+                        fname,
+                    )
+                    tables.append(cache.to_table(df, filters, source_columns))
                 else:
-                    mdata[season] = False
-                cache.dump(df, cache_path, cache.fname_rosters(season))
-                cache.dump_rosters_mdata(mdata, cache_path)
-                dfs.append(df)
+                    fname = cache.fname_rosters(season)
+                    cache.upgrade_column(
+                        cache_path, fname, EXTRA_DRAFT_ID, _create_extra_ID
+                    )
+                    tables.append(
+                        cache.load_table(cache_path, fname, source_columns, filters)
+                    )
+        if len(stale) > 0:
+            cache.revalidate_seasons(
+                get,
+                "rosters",
+                seasons,
+                cache_path,
+                columns,
+                filters,
+                arrow_strings,
+                as_arrow,
+                max_staleness,
+                on_refresh,
+            )
     else:
+        fetched = cache.fetch(
+            functools.partial(
+                _fetch_season, columns=cache.read_columns(source_columns, filters)
+            ),
+            seasons,
+        )
         for season in seasons:
-            dfs.append(nfl_data_py.import_weekly_rosters([season]))
-    df = pandas.concat(dfs)
-    df = _roster_cols_rename(df)
-    df = _create_extra_ID(df)
-    return df
+            tables.append(cache.to_table(fetched[season], filters, source_columns))
+    table = _roster_cols_rename(cache.concat_tables(tables))
+    if columns is not None:
+        table = table.select(columns)
+    return cache.output(table, as_arrow, arrow_strings)
+
+
+async def aget(*args, **kwargs) -> pandas.DataFrame | pyarrow.Table:
+    """
+    Awaitable `get()` taking the same parameters. Cache reads and web fetches run in a worker
+    thread so the event loop is not blocked, and several calls (of any dataset) may be awaited
+    concurrently, bounded by `cache.set_async_limit()`.
+
+    Examples
+    --------
+
+        >>> dfs = await asyncio.gather(rosters.aget([2022], "path_to_cache/"), rosters.aget([2023], "path_to_cache/"))
+    """
+    return await cache.run_async(get, *args, **kwargs)
+
+
+def iter_seasons(
+    seasons: list[int],
+    cache_path: str = None,
+    update_last_season: bool = False,
+    columns: list = None,
+    filters: dict | list = None,
+    arrow_strings: bool = None,
+    chunk=None,
+) -> Iterator[pandas.DataFrame]:
+    """
+    Iterate over roster data one season (or one chunk of a season) at a time, so that only a single
+    season is held in memory. Takes the same parameters as `get()`, as well as `chunk`.
+
+    Parameters
+    ----------
+
+    chunk : str | cols class = None
+        Column to split each season by, i.e. `cols.Week.header`. Whole seasons are yielded if `None`.
+
+    Returns
+    -------
+
+        out : Iterator[pandas.DataFrame]
+
+    Examples
+    --------
+
+        >>> for df in rosters.iter_seasons(range(2002, 2025), "path_to_cache/"):
+        >>>     ...
+    """
+    columns = cache.headers(columns)
+    chunk = None if chunk is None else cache.headers([chunk])[0]
+    for season in seasons:
+        df = get(
+            [season],
+            cache_path,
+            update_last_season,
+            cache.chunk_columns(columns, chunk),
+            filters,
+            arrow_strings,
+        )
+        yield from cache.iter_chunks(df, chunk, columns)
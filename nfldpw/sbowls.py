@@ -1,9 +1,9 @@
 import datetime
 import pandas
-import requests
 import io
 import json
 from .cache import cache
+from .cache import formats
 import os
 
 
@@ -11,6 +11,23 @@ SBOWL_LINK = "https://en.wikipedia.org/wiki/List_of_Super_Bowl_champions"
 PAST_BOWLS_TABLE_INDEX = 1
 FUTURE_BOWLS_TABLE_INDEX = 2
 
+DATE_FORMAT = "%Y%m%d"
+
+# Dates of every played and scheduled Super Bowl, refreshed from Wikipedia once the last one
+# has passed (see `load_superbowl_dates()`).
+SUPERBOWL_DATES = """
+19670115 19680114 19690112 19700111 19710117 19720116 19730114 19740113
+19750112 19760118 19770109 19780115 19790121 19800120 19810125 19820124
+19830130 19840122 19850120 19860126 19870125 19880131 19890122 19900128
+19910127 19920126 19930131 19940130 19950129 19960128 19970126 19980125
+19990131 20000130 20010128 20020203 20030126 20040201 20050206 20060205
+20070204 20080203 20090201 20100207 20110206 20120205 20130203 20140202
+20150201 20160207 20170205 20180204 20190203 20200202 20210207 20220213
+20230212 20240211 20250209 20260208 20270214
+""".split()
+
+_MEMO = {}
+
 
 def _parse_raw_date(date_raw: str) -> datetime.datetime:
     count = 0
@@ -34,6 +51,8 @@ def _get_table_dates(df: pandas.DataFrame) -> list[datetime.datetime]:
 
 
 def _get_sbowls() -> list[datetime.datetime]:
+    import requests
+
     text = requests.get(SBOWL_LINK).text
     tables = pandas.read_html(io.StringIO(text))
     past = tables[PAST_BOWLS_TABLE_INDEX]
@@ -43,31 +62,66 @@ def _get_sbowls() -> list[datetime.datetime]:
     return past_dates + future_dates
 
 
+def _parse_dates(dates_str: list[str]) -> list[datetime.datetime]:
+    return [datetime.datetime.strptime(date, DATE_FORMAT) for date in dates_str]
+
+
+def _read_cache(cache_path: str) -> list[datetime.datetime]:
+    path = cache_path + cache.fname_superbowls() + ".json"
+    if not os.path.exists(path):
+        return []
+    with open(path, "r") as file:
+        return _parse_dates(json.load(file))
+
+
+def _write_cache(cache_path: str, dates: list[datetime.datetime]):
+    path = cache_path + cache.fname_superbowls() + ".json"
+    dates_str = [datetime.datetime.strftime(date, DATE_FORMAT) for date in dates]
+    temp_path = formats.temporary_path(path)
+    try:
+        with open(temp_path, "w") as file:
+            json.dump(dates_str, file)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _merge(*date_lists: list[datetime.datetime]) -> list[datetime.datetime]:
+    return sorted(set(date for dates in date_lists for date in dates))
+
+
 def load_superbowl_dates(
     cache_path: str = None, update_cache: bool = False
 ) -> list[datetime.datetime]:
     """
-    Load all past and scheduled future Super Bowl dates using Wikopedia.
-    If `cache_path` is given, load from the cache unless `update_cache = True` in which case data
-    is loaded from Wikopedia and used to update the cache.
+    Load all past and scheduled future Super Bowl dates. Dates come from the table bundled with
+    the package (`SUPERBOWL_DATES`), merged with the dates cached in `cache_path` if given, and
+    are memoized per cache directory for the lifetime of the process.
+
+    Wikipedia is only scraped when `update_cache = True` or when the last known Super Bowl has
+    passed (at most once per process and cache directory, keeping the known dates if the request
+    fails). Scraped dates are stored in the cache if `cache_path` is given.
     """
+    today = datetime.datetime.today()
+    memo = _MEMO.setdefault(cache_path, {})
+    if not update_cache and "dates" in memo:
+        if memo["dates"][-1] >= today or memo["attempted"]:
+            return list(memo["dates"])
+    dates = _parse_dates(SUPERBOWL_DATES)
     if cache_path:
-        if update_cache:
-            dates = _get_sbowls()
-            dates_str = []
-            for i in range(0, len(dates)):
-                dates_str.append(datetime.datetime.strftime(dates[i], "%Y%m%d"))
-            with open(cache_path + cache.fname_superbowls() + ".json", "w") as file:
-                json.dump(dates_str, file)
-            return dates
-        else:
-            dates = []
-            path = cache_path + cache.fname_superbowls() + ".json"
-            if os.path.exists(path):
-                with open(path, "r") as file:
-                    dates = json.load(file)
-                for i in range(0, len(dates)):
-                    dates[i] = datetime.datetime.strptime(dates[i], "%Y%m%d")
-            return dates
-    else:
-        return _get_sbowls()
+        dates = _merge(dates, _read_cache(cache_path))
+    scraped = False
+    attempted = update_cache or dates[-1] < today
+    if attempted:
+        try:
+            dates = _merge(dates, _get_sbowls())
+            scraped = True
+        except Exception:
+            if update_cache:
+                raise
+        if scraped and cache_path:
+            _write_cache(cache_path, dates)
+    memo["dates"] = dates
+    memo["attempted"] = attempted or memo.get("attempted", False)
+    return list(dates)
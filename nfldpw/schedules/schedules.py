@@ -1,24 +1,42 @@
 import pandas
-import nfl_data_py
+import pyarrow
+from typing import Iterator
 from .. import cache
-from .. import sbowls
+from .. import completeness
 
 
-def _season_complete(df: pandas.DataFrame, cache_path: str) -> bool:
-    sb_dates = sbowls.load_superbowl_dates(cache_path)
-    sb_cands = pandas.to_datetime(df["gameday"]).isin(sb_dates).sum()
-    complete = sb_cands > 0
-    return complete
+def _fetch_seasons(seasons: list[int]) -> dict[int, pandas.DataFrame]:
+    """
+    Fetch `seasons` with a single download of the upstream file (which covers every season) and
+    split it into one frame per season.
+    """
+    if len(seasons) == 0:
+        return {}
+    import nfl_data_py
+    from . import cols
+
+    df = cache.compact(nfl_data_py.import_schedules(seasons), cols)
+    return cache.split_seasons(df, seasons, cols.Season.header)
 
 
 def get(
-    seasons: list[int], cache_path: str = None, update_last_season: bool = False
-) -> pandas.DataFrame:
+    seasons: list[int],
+    cache_path: str = None,
+    update_last_season: bool = False,
+    columns: list = None,
+    filters: dict | list = None,
+    arrow_strings: bool = None,
+    as_arrow: bool = False,
+    max_staleness: float = 0,
+    background: bool = False,
+    on_refresh=None,
+) -> pandas.DataFrame | pyarrow.Table:
     """
     Get schedules data for the list of seasons provided.
     If a cache path is provided, data will be read from the cache
     or stored in the cache if calling for the first time. Otherwise,
     data is loaded from the web source.
+    Seasons missing from the cache are fetched from the web source in a single download.
 
     Parameters
     ----------
@@ -32,40 +50,149 @@ def get(
     update_last_season : bool = False
         Whether cached seasons that are incomplete should be reloaded (i.e. after a new week has ended).
 
+    columns : list = None
+        Columns to load, given as header strings or `cols` classes. All columns are loaded if `None`.
+
+    filters : dict | list = None
+        Row filters pushed down into the cache read, i.e. `{cols.Week: 5, cols.GameType: cols.GameType.REG}`
+        or `[(cols.Week, ">=", 5)]`. See `cache.predicates()` for the accepted forms.
+
+    arrow_strings : bool = None
+        Whether string columns are returned as Arrow-backed `string[pyarrow]` instead of Python objects.
+        Defaults to `cache.set_arrow_strings()` (`True`).
+
+    as_arrow : bool = False
+        Whether to return the assembled `pyarrow.Table` instead of converting it to pandas.
+
+    max_staleness : float = 0
+        Seconds for which a cached incomplete season is considered fresh. `update_last_season` only reloads
+        seasons fetched longer ago than this.
+
+    background : bool = False
+        Stale-while-revalidate: with `update_last_season`, return the cached copy of incomplete seasons immediately
+        and reload them in a background thread (see `cache.wait_for_refreshes()`).
+
+    on_refresh : Callable[[pandas.DataFrame], None] = None
+        Called with the refreshed result (same seasons, columns and filters) once a background reload has finished.
+
     Returns
     -------
 
-        out : pandas.DataFrame
+        out : pandas.DataFrame | pyarrow.Table
 
     Examples
     --------
 
         >>> schedules.get([2020, 2021, 2022], "path_to_cache/")
     """
-    dfs = []
+    columns = cache.headers(columns)
+    filters = cache.predicates(filters)
+    arrow_strings = cache.use_arrow_strings(arrow_strings)
+    tables = []
     if cache_path:
-        mdata = cache.load_schedules_mdata(cache_path)
-        dfs = []
-        for season in seasons:
-            from_cache = True
-            if season in mdata:
-                if not mdata[season] and update_last_season:
-                    from_cache = False
-            else:
-                from_cache = False
-            if from_cache:
-                dfs.append(cache.load(cache_path, cache.fname_schedules(season)))
-            else:
-                df = nfl_data_py.import_schedules([season])
-                if _season_complete(df, cache_path):
-                    mdata[season] = True
+        with cache.MdataStore(cache_path) as mdata:
+            missing, stale = cache.classify(
+                mdata,
+                "schedules",
+                seasons,
+                update_last_season,
+                max_staleness,
+                background,
+            )
+            fetched = _fetch_seasons(missing)
+            for season in seasons:
+                if season in fetched:
+                    df = fetched[season]
+                    fname = cache.fname_schedules(season)
+                    cache.dump(df, cache_path, fname)
+                    mdata.set(
+                        "schedules",
+                        cache.partition(season),
+                        completeness.schedule_complete(df, season, cache_path),
+                        df,
+                        fname,
+                    )
+                    tables.append(cache.to_table(df, filters, columns))
                 else:
-                    mdata[season] = False
-                cache.dump(df, cache_path, cache.fname_schedules(season))
-                cache.dump_schedules_mdata(mdata, cache_path)
-                dfs.append(df)
+                    tables.append(
+                        cache.load_table(
+                            cache_path, cache.fname_schedules(season), columns, filters
+                        )
+                    )
 
+        if len(stale) > 0:
+            cache.revalidate_seasons(
+                get,
+                "schedules",
+                seasons,
+                cache_path,
+                columns,
+                filters,
+                arrow_strings,
+                as_arrow,
+                max_staleness,
+                on_refresh,
+            )
     else:
+        fetched = _fetch_seasons(seasons)
         for season in seasons:
-            dfs.append(nfl_data_py.import_schedules([season]))
-    return pandas.concat(dfs)
+            tables.append(cache.to_table(fetched[season], filters, columns))
+    return cache.output(cache.concat_tables(tables), as_arrow, arrow_strings)
+
+
+async def aget(*args, **kwargs) -> pandas.DataFrame | pyarrow.Table:
+    """
+    Awaitable `get()` taking the same parameters. Cache reads and web fetches run in a worker
+    thread so the event loop is not blocked, and several calls (of any dataset) may be awaited
+    concurrently, bounded by `cache.set_async_limit()`.
+
+    Examples
+    --------
+
+        >>> dfs = await asyncio.gather(schedules.aget([2022], "path_to_cache/"), rosters.aget([2022], "path_to_cache/"))
+    """
+    return await cache.run_async(get, *args, **kwargs)
+
+
+def iter_seasons(
+    seasons: list[int],
+    cache_path: str = None,
+    update_last_season: bool = False,
+    columns: list = None,
+    filters: dict | list = None,
+    arrow_strings: bool = None,
+    chunk=None,
+) -> Iterator[pandas.DataFrame]:
+    """
+    Iterate over schedules data one season (or one chunk of a season) at a time, so that only a single
+    season is held in memory. Takes the same parameters as `get()`, as well as `chunk`.
+
+    Parameters
+    ----------
+
+    chunk : str | cols class = None
+        Column to split each season by, i.e. `cols.Week.header`. Whole seasons are yielded if `None`.
+
+    Returns
+    -------
+
+        out : Iterator[pandas.DataFrame]
+
+    Examples
+    --------
+
+        >>> for df in schedules.iter_seasons(range(1999, 2025), "path_to_cache/"):
+        >>>     ...
+    """
+    columns = cache.headers(columns)
+    chunk = None if chunk is None else cache.headers([chunk])[0]
+    for season in seasons:
+        df = get(
+            [season],
+            cache_path,
+            update_last_season,
+            cache.chunk_columns(columns, chunk),
+            filters,
+            arrow_strings,
+        )
+        yield from cache.iter_chunks(df, chunk, columns)